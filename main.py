@@ -988,10 +988,11 @@ while running:
     
     # feed events to store
     store_consumed_events = False
-    for event in events:
-        if store.handle_event(event):
-            store_consumed_events = True
-            break  # store consumed the event
+    if store.active:
+        for event in events:
+            if store.handle_event(event):
+                store_consumed_events = True
+                break  # store consumed the event
     
     # feed events to End of Wave Screen
     eos_consumed_events = False
@@ -1122,7 +1123,8 @@ while running:
         end_of_wave_screen.update(ms)
     
     # ---------------- Store update ----------------
-    store.update(ms)
+    if store.active:
+        store.update(ms)
     
     # ---------------- Apply upgrade effects ----------------
     effective_ms = ms if (not store.active and not pause_menu.active) else 0
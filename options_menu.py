@@ -383,6 +383,10 @@ class OptionsMenu:
                 if hasattr(coin_module, 'update_coin_volumes'):
                     coin_module.update_coin_volumes()
             
+            # The store keeps its sounds on the Store instance
+            if 'store' in sys.modules:
+                sys.modules['store'].get_store().on_options_changed(self.settings)
+            
             # Also apply to any other sound objects in various modules
             modules_to_check = ['heart', 'store', 'paddle_intro']
             for module_name in modules_to_check:
@@ -319,8 +319,9 @@ class PauseMenu:
             if idx == self.selected_index:
                 pygame.draw.rect(surface, YELLOW, box_rect, 4)
         
-        # Draw quit confirmation dialog on top if active
-        self.quit_dialog.draw(surface)
+        # Draw quit confirmation dialog on top if active (skip the call while hidden)
+        if self.quit_dialog.active:
+            self.quit_dialog.draw(surface)
 
     # ----------------------------------------------------------------
     # Helper methods (copied from TutorialOverlay for consistency) ----
@@ -1,15 +1,49 @@
 import pygame
+from functools import lru_cache
 from config import WIDTH, HEIGHT, WHITE, YELLOW, RED, get_control_key
 
+
+@lru_cache(maxsize=64)
+def _render_outline_cached(text: str, font: pygame.font.Font, fg, outline, px: int = 1):
+    """Render text with a pixel outline.
+
+    The outline glyphs are rasterised once and stamped at the four
+    cardinal offsets, which is enough for a crisp pixel-font outline.
+    All dialog strings are constant, so results are memoised and the
+    returned surface must be treated as read-only.
+    """
+    base = font.render(text, True, fg)
+    outline_surf = font.render(text, True, outline)
+    w, h = base.get_size()
+    surf = pygame.Surface((w + px * 2, h + px * 2), pygame.SRCALPHA)
+    blit = surf.blit
+    for dx, dy in ((0, px), (px * 2, px), (px, 0), (px, px * 2)):
+        blit(outline_surf, (dx, dy))
+    blit(base, (px, px))
+    # Match the display's pixel format so the cached surface blits on the fast path
+    return surf.convert_alpha()
+
+
 class QuitConfirmationDialog:
-    """Confirmation dialog to prevent accidental quits during gameplay."""
+    """Confirmation dialog to prevent accidental quits during gameplay.
+
+    Callers are expected to gate per-frame ``update``/``draw`` calls on the
+    ``active`` attribute so the hidden dialog costs nothing.
+    """
+
+    __slots__ = ("active", "selected_option", "overlay",
+                 "title_font", "subtitle_font", "btn_font",
+                 "dialog_width", "dialog_height", "dialog_rect",
+                 "buttons", "btn_rects", "_chrome_sel", "_chrome_unsel",
+                 "_title_surf", "_title_rect", "_warning_surf", "_warning_rect")
     
     def __init__(self):
         self.active = False
         self.selected_option = 0  # 0 = Cancel, 1 = Quit
         
-        # Semi-transparent overlay
-        self.overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        # Semi-transparent overlay, stored pre-multiplied (black, so the colour
+        # channels are already zero) and blitted with BLEND_PREMULTIPLIED
+        self.overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
         self.overlay.fill((0, 0, 0, 200))
         
         # Load fonts
@@ -33,6 +67,7 @@ class QuitConfirmationDialog:
             ("Quit", self._quit)
         ]
         
+        self._layout_text()
         self._layout_buttons()
         
     def _load_pixel_font(self, size):
@@ -41,17 +76,22 @@ class QuitConfirmationDialog:
         return load_font('PressStart2P-Regular.ttf', size)
     
     def _render_outline(self, text: str, font: pygame.font.Font, fg, outline, px: int = 1):
-        """Render text with a pixel outline."""
-        base = font.render(text, True, fg)
-        w, h = base.get_size()
-        surf = pygame.Surface((w + px * 2, h + px * 2), pygame.SRCALPHA)
-        for dx in range(-px, px + 1):
-            for dy in range(-px, px + 1):
-                if dx == 0 and dy == 0:
-                    continue
-                surf.blit(font.render(text, True, outline), (dx + px, dy + px))
-        surf.blit(base, (px, px))
-        return surf
+        """Render text with a pixel outline (cached, see _render_outline_cached)."""
+        return _render_outline_cached(text, font, fg, outline, px)
+    
+    def _layout_text(self):
+        """Render the title and pick the warning variant that fits, once."""
+        self._title_surf = self._render_outline("Quit Game?", self.title_font, RED, (0, 0, 0), 2)
+        self._title_rect = self._title_surf.get_rect(centerx=self.dialog_rect.centerx,
+                                                     y=self.dialog_rect.y + 50)
+        
+        # Make the warning shorter if the full sentence overflows the dialog
+        for warning_text in ("Current progress will be lost!", "Progress will be lost!"):
+            self._warning_surf = self._render_outline(warning_text, self.subtitle_font, YELLOW, (0, 0, 0), 1)
+            self._warning_rect = self._warning_surf.get_rect(centerx=self.dialog_rect.centerx,
+                                                             y=self._title_rect.bottom + 45)
+            if self._warning_rect.right <= self.dialog_rect.right - 20:
+                break
     
     def _layout_buttons(self):
         """Precompute button rectangles."""
@@ -68,6 +108,26 @@ class QuitConfirmationDialog:
             x = start_x + i * (button_width + gap)
             rect = pygame.Rect(x, button_y, button_width, button_height)
             self.btn_rects.append(rect)
+        
+        # All buttons share one size, so one chrome surface per state suffices
+        self._chrome_sel = self._build_button_chrome(button_width, button_height, True)
+        self._chrome_unsel = self._build_button_chrome(button_width, button_height, False)
+    
+    def _build_button_chrome(self, width, height, selected):
+        """Pre-render button background, border and bevel for one state."""
+        chrome = pygame.Surface((width, height))
+        rect = chrome.get_rect()
+        chrome.fill((80, 80, 80) if selected else (60, 60, 60))
+        pygame.draw.rect(chrome, WHITE, rect, 2)
+        if selected:
+            pygame.draw.rect(chrome, YELLOW, rect, 3)
+        else:
+            # Bevel as two polylines: light left/top edges, dark bottom/right
+            bottom_left = (rect.left, rect.bottom - 1)
+            top_right = (rect.right - 1, rect.top)
+            pygame.draw.lines(chrome, (200, 200, 200), False, [bottom_left, rect.topleft, top_right])
+            pygame.draw.lines(chrome, (30, 30, 30), False, [bottom_left, (rect.right - 1, rect.bottom - 1), top_right])
+        return chrome
     
     def show(self):
         """Show the confirmation dialog."""
@@ -96,13 +156,17 @@ class QuitConfirmationDialog:
         result = None
         consumed_event = False
         
-        # Handle keyboard navigation
+        key_up = get_control_key('right_paddle_up')
+        key_down = get_control_key('right_paddle_down')
+        
+        # Single pass: keyboard navigation and left-click detection
+        clicked = False
         for e in events:
             if e.type == pygame.KEYDOWN:
                 consumed_event = True
-                if e.key == get_control_key('right_paddle_up') or e.key == pygame.K_LEFT:
+                if e.key == key_up or e.key == pygame.K_LEFT:
                     self.selected_option = (self.selected_option - 1) % len(self.buttons)
-                elif e.key == get_control_key('right_paddle_down') or e.key == pygame.K_RIGHT:
+                elif e.key == key_down or e.key == pygame.K_RIGHT:
                     self.selected_option = (self.selected_option + 1) % len(self.buttons)
                 elif e.key in (pygame.K_SPACE, pygame.K_RETURN):
                     # Activate the currently selected button
@@ -111,18 +175,19 @@ class QuitConfirmationDialog:
                 elif e.key == pygame.K_ESCAPE:
                     # ESC cancels the quit
                     result = self._cancel()
+            elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
+                clicked = True
+                consumed_event = True
         
         # Handle mouse input
         mouse_pos = pygame.mouse.get_pos()
-        clicked = any(e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 for e in events)
-        if clicked:
-            consumed_event = True
         
-        for i, (btn_rect, (label, callback)) in enumerate(zip(self.btn_rects, self.buttons)):
-            if btn_rect.collidepoint(mouse_pos):
+        btn_rects = self.btn_rects
+        for i in range(len(btn_rects)):
+            if btn_rects[i].collidepoint(mouse_pos):
                 self.selected_option = i
                 if clicked:
-                    result = callback()
+                    result = self.buttons[i][1]()
         
         return result if consumed_event else None
     
@@ -132,63 +197,27 @@ class QuitConfirmationDialog:
             return
         
         # Draw overlay
-        surface.blit(self.overlay, (0, 0))
+        surface.blit(self.overlay, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
         
         # Draw dialog box background
         pygame.draw.rect(surface, (40, 40, 40), self.dialog_rect)
         pygame.draw.rect(surface, WHITE, self.dialog_rect, 3)
         
-        # Draw title
-        title_surf = self._render_outline("Quit Game?", self.title_font, RED, (0, 0, 0), 2)
-        title_rect = title_surf.get_rect(centerx=self.dialog_rect.centerx, 
-                                        y=self.dialog_rect.y + 50)
-        surface.blit(title_surf, title_rect)
-        
-        # Draw warning text - make it shorter and ensure it fits
-        warning_text = "Current progress will be lost!"
-        warning_surf = self._render_outline(warning_text, self.subtitle_font, YELLOW, (0, 0, 0), 1)
-        warning_rect = warning_surf.get_rect(centerx=self.dialog_rect.centerx, 
-                                           y=title_rect.bottom + 45)
-        
-        # Ensure the warning text fits within dialog bounds
-        if warning_rect.right > self.dialog_rect.right - 20:
-            # If text is too wide, make it even shorter
-            warning_text = "Progress will be lost!"
-            warning_surf = self._render_outline(warning_text, self.subtitle_font, YELLOW, (0, 0, 0), 1)
-            warning_rect = warning_surf.get_rect(centerx=self.dialog_rect.centerx, 
-                                               y=title_rect.bottom + 45)
-        
-        surface.blit(warning_surf, warning_rect)
-        
-        # Draw buttons
-        for i, (btn_rect, (label, _)) in enumerate(zip(self.btn_rects, self.buttons)):
-            # Button colors
+        # Title and warning text are laid out once in _layout_text()
+        surface.blit(self._title_surf, self._title_rect)
+        surface.blit(self._warning_surf, self._warning_rect)
+        
+        # Draw buttons: pre-baked chrome plus cached label, batched in one call
+        seq = []
+        btn_rects = self.btn_rects
+        for i in range(len(btn_rects)):
+            btn_rect = btn_rects[i]
+            label = self.buttons[i][0]
             is_selected = (i == self.selected_option)
-            bg_color = (80, 80, 80) if is_selected else (60, 60, 60)
             text_color = YELLOW if is_selected else WHITE
-            
-            # Draw button background
-            pygame.draw.rect(surface, bg_color, btn_rect)
-            pygame.draw.rect(surface, WHITE, btn_rect, 2)
-            
-            # Draw button bevel
-            if is_selected:
-                pygame.draw.rect(surface, YELLOW, btn_rect, 3)
-            else:
-                # Light bevel
-                pygame.draw.line(surface, (200, 200, 200), btn_rect.topleft, 
-                               (btn_rect.topright[0]-1, btn_rect.topright[1]))
-                pygame.draw.line(surface, (200, 200, 200), btn_rect.topleft, 
-                               (btn_rect.topleft[0], btn_rect.bottomleft[1]-1))
-                # Dark bevel
-                pygame.draw.line(surface, (30, 30, 30), 
-                               (btn_rect.left, btn_rect.bottom-1), 
-                               (btn_rect.right-1, btn_rect.bottom-1))
-                pygame.draw.line(surface, (30, 30, 30), 
-                               (btn_rect.right-1, btn_rect.top), 
-                               (btn_rect.right-1, btn_rect.bottom))
-            
-            # Draw button text
+            chrome = self._chrome_sel if is_selected else self._chrome_unsel
             text_surf = self._render_outline(label, self.btn_font, text_color, (0, 0, 0), 1)
             text_rect = text_surf.get_rect(center=btn_rect.center)
-            surface.blit(text_surf, text_rect)
+            seq.append((chrome, btn_rect.topleft))
+            seq.append((text_surf, text_rect))
+        surface.blits(seq, doreturn=False)
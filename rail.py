@@ -1,4 +1,5 @@
 import pygame, math
+import numpy as np
 from typing import List, Tuple, Dict
 from config import WIDTH, HEIGHT, CANNON_GAP
 from perimeter import build_tracks
@@ -23,6 +24,38 @@ class RailInfo:
     def nearest_node(self, block_key: Tuple[int,int]):
         return self.block_to_rail.get(block_key, (0,0))
 
+# ---------------------------------------------------------------------------
+# Outward-side cache
+# ---------------------------------------------------------------------------
+
+# The rail point of a block depends only on its rect and the (fixed) screen
+# centre, so it is computed once per block geometry and reused by every
+# rebuild after the castle loses or regains blocks.
+_rail_pos_cache: Dict[Tuple[int,int,int,int], Tuple[int,int]] = {}
+
+def _cache_outward_positions(blocks: List[Rect]):
+    """Compute and cache the outward rail position for each of *blocks*."""
+    cx, cy = WIDTH//2, HEIGHT//2
+    n = len(blocks)
+    left    = np.fromiter((b.left    for b in blocks), dtype=np.int64, count=n)
+    right   = np.fromiter((b.right   for b in blocks), dtype=np.int64, count=n)
+    top     = np.fromiter((b.top     for b in blocks), dtype=np.int64, count=n)
+    bottom  = np.fromiter((b.bottom  for b in blocks), dtype=np.int64, count=n)
+    centerx = np.fromiter((b.centerx for b in blocks), dtype=np.int64, count=n)
+    centery = np.fromiter((b.centery for b in blocks), dtype=np.int64, count=n)
+
+    # Determine outward side (same heuristic as perimeter.build_tracks):
+    # horizontal faces win when |dx| > |dy|, otherwise vertical ones.
+    offset = CANNON_GAP + 3  # extra clearance for diagonal corner cuts
+    dx = centerx - cx
+    dy = centery - cy
+    horiz = np.abs(dx) > np.abs(dy)
+    px = np.where(horiz, np.where(dx > 0, right + offset, left - offset), centerx)
+    py = np.where(horiz, centery, np.where(dy > 0, bottom + offset, top - offset))
+
+    for b, pos in zip(blocks, zip(px.tolist(), py.tolist())):
+        _rail_pos_cache[(b.x, b.y, b.w, b.h)] = pos
+
 # ---------------------------------------------------------------------------
 # Public builder
 # ---------------------------------------------------------------------------
@@ -43,32 +76,15 @@ def build_rails(blocks: List[Rect], block_size: int) -> RailInfo:
     rail_points: List[List[Vector2]] = []
     block_to_rail: Dict[Tuple[int,int], Tuple[int,int]] = {}
 
-    bs = block_size
-    cx, cy = WIDTH//2, HEIGHT//2
-
     for tid, track in enumerate(tracks):
-        pts: List[Vector2] = []
+        keys = [(b.x, b.y, b.w, b.h) for b in track]
+        missing = [b for b, k in zip(track, keys) if k not in _rail_pos_cache]
+        if missing:
+            _cache_outward_positions(missing)
+
+        pts: List[Vector2] = [Vector2(_rail_pos_cache[k]) for k in keys]
         for idx, b in enumerate(track):
-            # Determine outward side (same heuristic as perimeter.build_tracks)
-            dx = b.centerx - cx
-            dy = b.centery - cy
-            if abs(dx) > abs(dy):
-                side = 'right' if dx > 0 else 'left'
-            else:
-                side = 'bottom' if dy > 0 else 'top'
-
-            offset = CANNON_GAP + 3  # extra clearance for diagonal corner cuts
-            if side == 'top':
-                pos = Vector2(b.centerx, b.top - offset)
-            elif side == 'bottom':
-                pos = Vector2(b.centerx, b.bottom + offset)
-            elif side == 'left':
-                pos = Vector2(b.left - offset, b.centery)
-            else:  # right
-                pos = Vector2(b.right + offset, b.centery)
-
-            pts.append(pos)
             block_to_rail[(b.x, b.y)] = (tid, idx)
         rail_points.append(pts)
 
-    return RailInfo(rail_points, block_to_rail) 
\ No newline at end of file
+    return RailInfo(rail_points, block_to_rail)
@@ -29,6 +29,7 @@ cg.BlockType enum.  This makes unit-testing trivial.
 from __future__ import annotations
 
 from typing import List, Tuple
+from itertools import chain, islice
 import numpy as np
 import random
 import math
@@ -57,6 +58,24 @@ def _lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
 
 
+# Anchor points (difficulty -> (p1, p2, p3)) for get_layer_probabilities,
+# staged once as arrays so the bracketing segment is found with searchsorted.
+_ANCHOR_D = np.array([5, 10, 15, 20, 25, 50, 60, 65, 70, 75, 80], dtype=float)
+_ANCHOR_P = np.array([
+    (1.0, 0.0, 0.0),     # Wave 1
+    (0.67, 0.33, 0.0),   # Wave 2
+    (0.6, 0.4, 0.0),     # Wave 3 – 5 % layer-2 only
+    (0.65, 0.35, 0.0),   # Wave 4 – 15 % layer-2, still no layer-3
+    (0.70, 0.20, 0.1),   # Wave 5 – first small batch of layer-3
+    (0.3, 0.5, 0.2),     # Reference
+    (0.18, 0.52, 0.3),   # More gradual
+    (0.12, 0.48, 0.4),   # More gradual
+    (0.06, 0.36, 0.58),  # More gradual
+    (0.0, 0.2, 0.8),     # Near max
+    (0.0, 0.0, 1.0),     # Max (all layer 3)
+])
+
+
 def get_layer_probabilities(difficulty: int | float) -> Tuple[float, float, float]:
     """Return a probability triple (layer1, layer2, layer3) based on *difficulty*.
 
@@ -64,62 +83,24 @@ def get_layer_probabilities(difficulty: int | float) -> Tuple[float, float, floa
     """
     d = float(max(0, min(100, difficulty)))
 
-    # Define anchor points as (difficulty, (p1, p2, p3))
-    anchors = [
-        (5,   (1.0, 0.0, 0.0)),   # Wave 1
-        (10,  (0.67, 0.33, 0.0)),   # Wave 2
-        (15,  (0.6, 0.4, 0.0)),  # Wave 3 – 5 % layer-2 only
-        (20,  (0.65, 0.35, 0.0)),  # Wave 4 – 15 % layer-2, still no layer-3
-        (25,  (0.70, 0.20, 0.1)), # Wave 5 – first small batch of layer-3
-        (50,  (0.3, 0.5, 0.2)),   # Reference
-        (60,  (0.18, 0.52, 0.3)), # More gradual
-        (65,  (0.12, 0.48, 0.4)), # More gradual
-        (70,  (0.06, 0.36, 0.58)),# More gradual
-        (75,  (0.0, 0.2, 0.8)),   # Near max
-        (80,  (0.0, 0.0, 1.0)),   # Max (all layer 3)
-    ]
-
-    # If below first anchor, return first
-    if d <= anchors[0][0]:
-        return anchors[0][1]
-    # If above last anchor, return last
-    if d >= anchors[-1][0]:
-        return anchors[-1][1]
-
-    # Find which two anchors d is between
-    for i in range(1, len(anchors)):
-        d0, p0 = anchors[i-1]
-        d1, p1 = anchors[i]
-        if d0 <= d <= d1:
-            t = (d - d0) / (d1 - d0)
-            l1 = p0[0] + (p1[0] - p0[0]) * t
-            l2 = p0[1] + (p1[1] - p0[1]) * t
-            l3 = p0[2] + (p1[2] - p0[2]) * t
-            return l1, l2, l3
-    # Fallback (should not reach here)
-    return anchors[-1][1]
+    # If below first anchor, return first; if above last anchor, return last
+    if d <= _ANCHOR_D[0]:
+        return tuple(_ANCHOR_P[0].tolist())
+    if d >= _ANCHOR_D[-1]:
+        return tuple(_ANCHOR_P[-1].tolist())
+
+    # Segment (i-1, i) brackets d; side='left' picks the lower segment when d
+    # sits exactly on an anchor, as the previous linear scan did.
+    i = int(np.searchsorted(_ANCHOR_D, d, side="left"))
+    d0, d1 = _ANCHOR_D[i - 1], _ANCHOR_D[i]
+    p0, p1 = _ANCHOR_P[i - 1], _ANCHOR_P[i]
+    t = (d - d0) / (d1 - d0)
+    return tuple((p0 + (p1 - p0) * t).tolist())
 
 # ---------------------------------------------------------------------------
 #  Reinforcement layer application
 # ---------------------------------------------------------------------------
 
-def _symmetry_group(h: int, w: int, y: int, x: int):
-    """Yield coordinates symmetric to (y,x) across the four main axes."""
-    coords = set([
-        (y, x),
-        (y, w - 1 - x),
-        (h - 1 - y, x),
-        (h - 1 - y, w - 1 - x),
-        (x, y),
-        (x, h - 1 - y),
-        (w - 1 - x, y),
-        (w - 1 - x, h - 1 - y),
-    ])
-    for cy, cx in coords:
-        if 0 <= cy < h and 0 <= cx < w:
-            yield cy, cx
-
-
 def apply_reinforcement_layers(mask: np.ndarray, difficulty: int | float, *, rng: random.Random | None = None) -> np.ndarray:
     """Upgrade layer-1 bricks in *mask* to layer-2 or layer-3 according to difficulty.
 
@@ -146,19 +127,38 @@ def apply_reinforcement_layers(mask: np.ndarray, difficulty: int | float, *, rng
         mask[mask == 2] = 4
         return mask
 
-    # Build symmetry groups starting from centre outwards
-    visited = np.zeros_like(mask, dtype=bool)
+    # Build symmetry groups starting from centre outwards.  The four-axis
+    # images of every layer-1 cell (its horizontal, vertical and diagonal
+    # mirrors, see sym_y/sym_x below) are computed in one vectorised pass as
+    # flat indices y*w+x; out-of-bounds images are masked out and in-bounds
+    # duplicates are dropped by sorting each row.  Only the row-major "first
+    # unvisited cell claims its group" walk stays in Python, because on
+    # non-square masks the images do not partition the grid and the claim
+    # order decides group membership.
+    cells = np.argwhere(mask == 2)
+    ys, xs = cells[:, 0], cells[:, 1]
+    sym_y = np.stack([ys, ys, h - 1 - ys, h - 1 - ys, xs, xs, w - 1 - xs, w - 1 - xs], axis=1)
+    sym_x = np.stack([xs, w - 1 - xs, xs, w - 1 - xs, ys, h - 1 - ys, ys, h - 1 - ys], axis=1)
+    in_bounds = (sym_y < h) & (sym_x < w)  # all images are already >= 0
+    keys = np.sort(np.where(in_bounds, sym_y * w + sym_x, -1), axis=1)
+    unique = keys >= 0
+    unique[:, 1:] &= keys[:, 1:] != keys[:, :-1]
+
+    flat_keys = keys[unique].tolist()
+    ends = np.cumsum(unique.sum(axis=1)).tolist()
+    own_keys = (ys * w + xs).tolist()
+    dists = np.hypot(ys - centre[0], xs - centre[1]).tolist()
+
+    visited = bytearray(h * w)
     groups: list[tuple[float, list[tuple[int, int]]]] = []
-
-    for y in range(h):
-        for x in range(w):
-            if mask[y, x] != 2 or visited[y, x]:
-                continue
-            coords = list(_symmetry_group(h, w, y, x))
-            for cy, cx in coords:
-                visited[cy, cx] = True
-            dist = math.hypot(y - centre[0], x - centre[1])
-            groups.append((dist, coords))
+    start = 0
+    for i, end in enumerate(ends):
+        if not visited[own_keys[i]]:
+            members = flat_keys[start:end]
+            for k in members:
+                visited[k] = 1
+            groups.append((dists[i], [divmod(k, w) for k in members]))
+        start = end
 
     groups.sort(key=lambda t: t[0])  # near-centre first
 
@@ -168,24 +168,24 @@ def apply_reinforcement_layers(mask: np.ndarray, difficulty: int | float, *, rng
     placed_l2 = placed_l3 = 0
 
     for dist, coords in groups:
-        # Determine eligible layers based on remaining quota
-        choices: list[int] = []  # values: 3 or 4
-        weights: list[float] = []
+        # Determine eligible layers based on remaining quota; an ineligible
+        # layer keeps a zero weight.
+        w4 = w3 = 0.0
         near_factor = 1.0 - (dist / max_dist)
 
         if placed_l3 < target_l3:
-            choices.append(4)
             # Strong preference for central groups when placing layer-3 bricks
-            weights.append(max(0.05, near_factor) * (target_l3 - placed_l3))
+            w4 = max(0.05, near_factor) * (target_l3 - placed_l3)
         if placed_l2 < target_l2:
-            choices.append(3)
             # layer-2 bricks distributed a bit more evenly
-            weights.append(max(0.05, 0.5 + (near_factor - 0.5)) * (target_l2 - placed_l2))
+            w3 = max(0.05, 0.5 + (near_factor - 0.5)) * (target_l2 - placed_l2)
 
-        if not choices:
+        if not (w4 or w3):
             continue
 
-        sel = rng.choices(choices, weights=weights, k=1)[0]
+        # Two-way inverse-CDF draw over [layer-3, layer-2]; consumes exactly one
+        # rng.random() like the rng.choices(..., k=1) call it replaces.
+        sel = 4 if rng.random() * (w4 + w3) < w4 else 3
         for cy, cx in coords:
             if mask[cy, cx] == 2:
                 mask[cy, cx] = sel
@@ -211,46 +211,51 @@ def plan_waves(mask: np.ndarray, num_waves: int = 10, *, max_first_wave: int = 4
     • Wave-10 (or final): prioritises layer-3 bricks.
     """
     h, w = mask.shape
-    layers: dict[int, list[tuple[int, int]]] = {2: [], 3: [], 4: []}
+    layers: dict[int, list[tuple[int, int]]] = {}
     centre = (h / 2.0, w / 2.0)
 
-    for y in range(h):
-        for x in range(w):
-            val = mask[y, x]
-            if val in layers:
-                layers[val].append((y, x))
-
-    # sort by centrality (closer first)
-    for key in layers:
-        layers[key].sort(key=lambda p: math.hypot(p[0] - centre[0], p[1] - centre[1]))
+    # Collect each layer's (y,x) coordinates in row-major order and sort them
+    # by centrality (closer first).  The stable argsort keeps row-major order
+    # for equidistant blocks, matching the previous list.sort behaviour.
+    for key in (2, 3, 4):
+        coords = np.argwhere(mask == key)
+        dists = np.hypot(coords[:, 0] - centre[0], coords[:, 1] - centre[1])
+        order = np.argsort(dists, kind="stable")
+        layers[key] = [tuple(p) for p in coords[order].tolist()]
 
     waves: List[List[Tuple[int, int]]] = [[] for _ in range(num_waves)]
 
+    # Each layer list is consumed front-to-back through a cursor instead of
+    # re-slicing the remainder after every wave.
+    l2, l3, l4 = layers[2], layers[3], layers[4]
+
     # Wave 1
-    waves[0] = layers[2][:max_first_wave]
-    layers[2] = layers[2][max_first_wave:]
+    waves[0] = l2[:max_first_wave]
+    i2 = len(waves[0])
+    i3 = 0
 
     # Wave 2
     need = max(0, min_second_wave - len(waves[1]))
-    take_l1 = min(len(layers[2]), need)
-    waves[1].extend(layers[2][:take_l1])
-    layers[2] = layers[2][take_l1:]
+    take_l1 = min(len(l2) - i2, need)
+    waves[1].extend(islice(l2, i2, i2 + take_l1))
+    i2 += take_l1
     need -= take_l1
     if need > 0:
-        take_l2 = min(len(layers[3]), need)
-        waves[1].extend(layers[3][:take_l2])
-        layers[3] = layers[3][take_l2:]
+        take_l2 = min(len(l3), need)
+        waves[1].extend(islice(l3, take_l2))
+        i3 = take_l2
 
     # Middle waves (3 .. num_waves-2)
     remaining_waves = max(0, num_waves - 3)
-    all_mid = layers[2] + layers[3]
-    per_wave = math.ceil(len(all_mid) / max(1, remaining_waves)) if remaining_waves else 0
-    idx = 0
+    mid_total = (len(l2) - i2) + (len(l3) - i3)
+    per_wave = math.ceil(mid_total / max(1, remaining_waves)) if remaining_waves else 0
+    all_mid = chain(islice(l2, i2, None), islice(l3, i3, None))
     for wv in range(2, num_waves - 1):
-        waves[wv].extend(all_mid[idx: idx + per_wave])
-        idx += per_wave
+        waves[wv].extend(islice(all_mid, per_wave))
 
     # Final wave – dump everything left, prioritising layer-3 bricks
-    waves[-1].extend(layers[4] + layers[3] + layers[2])
+    waves[-1].extend(l4)
+    waves[-1].extend(islice(l3, i3, None))
+    waves[-1].extend(islice(l2, i2, None))
 
     return waves 
\ No newline at end of file
@@ -1,8 +1,95 @@
-import pygame, random, math
+import pygame, math
+import numpy as np
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 from config import WIDTH, HEIGHT, SCALE, WHITE, YELLOW, get_control_key
 import coin
 
+# Upper bound on cached text surfaces (coin counts and wave titles keep changing)
+_TEXT_CACHE_MAX = 512
+
+# Most feedback messages shown at once
+_FEEDBACK_MAX = 8
+
+# Buy button fill indexed by affordability: (can't afford, can afford)
+_BUY_BUTTON_COLORS = ((150, 50, 50), (50, 150, 50))
+
+# Purchase particles: gold, with alpha quantised to buckets of this width
+_PARTICLE_COLOR = (255, 215, 0)
+_PARTICLE_ALPHA_STEP = 16
+_PARTICLE_LIFE = 60        # frames
+_PARTICLE_BURST = 15       # particles per purchase
+_PARTICLE_CAPACITY = 512   # live particles kept; the oldest are dropped beyond this
+# Particle position and velocity are int32 fixed point with this many fraction bits
+_PARTICLE_FRAC_BITS = 8
+_PARTICLE_GRAVITY = 51     # 0.2 px/frame^2, rounded to fixed point
+
+def _spawn_particles(xy: np.ndarray, vel: np.ndarray, life: np.ndarray, center: Tuple[int, int]):
+    """Fill particle buffer rows in place with a burst around *center*.
+
+    Random direction and speed (2-6 px/frame) with up to 10 px of positional
+    jitter; pure array maths on views of the Store's particle buffers, which
+    hold fixed-point values (see _PARTICLE_FRAC_BITS).
+    """
+    n = len(life)
+    one = 1 << _PARTICLE_FRAC_BITS
+    angles = np.random.uniform(0, 2 * math.pi, n)
+    speeds = np.random.uniform(2, 6, n) * one
+    vel[:, 0] = np.rint(np.cos(angles) * speeds)
+    vel[:, 1] = np.rint(np.sin(angles) * speeds)
+    xy[:] = np.rint((center + np.random.uniform(-10, 10, (n, 2))) * one)
+    life[:] = _PARTICLE_LIFE
+
+
+def _advance_particles(xy: np.ndarray, vel: np.ndarray, life: np.ndarray, n: int) -> int:
+    """Advance the first *n* particle rows by one frame; return the live count.
+
+    Integrates position, applies gravity, ages every particle and compacts
+    the survivors to the front of the buffers, keeping their order.  All
+    arithmetic is integer (fixed-point position and velocity).
+    """
+    live_xy, live_vel, live_life = xy[:n], vel[:n], life[:n]
+    live_xy += live_vel
+    live_vel[:, 1] += _PARTICLE_GRAVITY
+    live_life -= 1
+    alive = live_life > 0
+    if alive.all():
+        return n
+    k = int(np.count_nonzero(alive))
+    xy[:k] = live_xy[alive]
+    vel[:k] = live_vel[alive]
+    life[:k] = live_life[alive]
+    return k
+
+
+@lru_cache(maxsize=1024)
+def _wrap_text_cached(text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
+    """Wrap text into a tuple of lines that fit within max_width.
+
+    Each line greedily takes as many words as fit (at least one, so an
+    over-long word gets a line of its own).  Rendered width grows with the
+    word count, so the cut point is found by binary search, costing
+    O(log words) font.size() calls per line.  Upgrade descriptions and row
+    widths never change, so results are memoised.
+    """
+    words = text.split()
+    lines = []
+    start = 0
+    while start < len(words):
+        lo, hi = 1, len(words) - start
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if font.size(' '.join(words[start:start + mid]))[0] <= max_width:
+                lo = mid
+            else:
+                hi = mid - 1
+        lines.append(' '.join(words[start:start + lo]))
+        start += lo
+    return tuple(lines)
+
+
 # -----------------------------------------------------------------------------
 # Store System - Tabbed interface for purchasing upgrades between waves
 # -----------------------------------------------------------------------------
@@ -10,6 +97,11 @@ import coin
 class StoreUpgrade:
     """Represents a single upgrade item in the store."""
     
+    __slots__ = ("id", "name", "description", "base_cost", "max_level", "current_level",
+                 "upgrade_type", "cost_multiplier", "purchased",
+                 "_cost_table", "_cost_fn", "_can_purchase_fn", "_cached_surface", "_cached_key",
+                 "_layout")
+    
     def __init__(self, id: str, name: str, description: str, cost: int, max_level: int = 1, 
                  upgrade_type: str = "single", cost_multiplier: float = 1.5):
         self.id = id
@@ -21,24 +113,50 @@ class StoreUpgrade:
         self.upgrade_type = upgrade_type  # "single", "tiered", "consumable"
         self.cost_multiplier = cost_multiplier
         self.purchased = False
+        
+        # Tiered cost for each level, computed once instead of a pow() per call
+        self._cost_table = [int(cost * (cost_multiplier ** level)) for level in range(max_level + 1)]
+        
+        # The upgrade type never changes, so resolve its cost and purchase
+        # rules once (unknown types fall back like the original if-chains did)
+        self._cost_fn = {"consumable": self._cost_consumable,
+                         "tiered": self._cost_tiered}.get(upgrade_type, self._cost_single)
+        self._can_purchase_fn = {"single": self._can_purchase_single,
+                                 "tiered": self._can_purchase_tiered}.get(upgrade_type, self._can_purchase_consumable)
+        
+        # Pre-composited store row and the state it was drawn for (see Store._upgrade_row_surface)
+        self._cached_surface: Optional[pygame.Surface] = None
+        self._cached_key: Optional[Tuple] = None
+        # (content width, row height) of the last store layout (see Store._item_height)
+        self._layout: Optional[Tuple[int, int]] = None
 
     def get_current_cost(self) -> int:
         """Calculate cost for next level based on current progress."""
-        if self.upgrade_type == "consumable":
-            return self.base_cost
-        elif self.upgrade_type == "tiered":
-            return int(self.base_cost * (self.cost_multiplier ** self.current_level))
-        else:  # single
-            return self.base_cost if not self.purchased else 0
+        return self._cost_fn()
+
+    def _cost_consumable(self) -> int:
+        return self.base_cost
+
+    def _cost_tiered(self) -> int:
+        if self.current_level < len(self._cost_table):
+            return self._cost_table[self.current_level]
+        return int(self.base_cost * (self.cost_multiplier ** self.current_level))
+
+    def _cost_single(self) -> int:
+        return self.base_cost if not self.purchased else 0
 
     def can_purchase(self) -> bool:
         """Check if this upgrade can be purchased."""
-        if self.upgrade_type == "single":
-            return not self.purchased
-        elif self.upgrade_type == "tiered":
-            return self.current_level < self.max_level
-        else:  # consumable
-            return True
+        return self._can_purchase_fn()
+
+    def _can_purchase_single(self) -> bool:
+        return not self.purchased
+
+    def _can_purchase_tiered(self) -> bool:
+        return self.current_level < self.max_level
+
+    def _can_purchase_consumable(self) -> bool:
+        return True
 
     def purchase(self) -> bool:
         """Attempt to purchase this upgrade. Returns True if successful."""
@@ -58,8 +176,73 @@ class StoreUpgrade:
         return False
 
 
+# Store catalogue: (tab name, ((id, name, description, cost, max_level, upgrade_type), ...)),
+# in tab order.  Store._initialize_upgrades builds fresh StoreUpgrade objects from it.
+_UPGRADE_CATALOG = (
+    ("Restoration", (
+        ("paddle_heal", "Healer's Balm",
+         "Restore your paddle to full length", 15, 1, "consumable"),
+        ("wall_repair", "Stone Mason's Kit",
+         "Repair damaged castle wall blocks", 25, 1, "consumable"),
+        ("repair_drone", "Golem Servant",
+         "Deploy an automaton that slowly repairs wall damage", 120, 1, "single"),
+        ("emergency_heal", "Angel's Grace",
+         "Automatically heal when paddle becomes critically small", 90, 2, "tiered"),
+    )),
+    ("Upgrades", (
+        ("fortified_walls", "Fortified Walls",
+         "Upgrade your castle wall to reinforced (level 1) and then fortress grade (level 2)", 60, 2, "tiered"),
+        ("paddle_width", "Giant's Grip",
+         "Permanently widen your paddle for better deflection", 50, 5, "tiered"),
+        ("paddle_agility", "Wind Walker's Grace",
+         "Reduce paddle inertia for snappier movement", 45, 3, "tiered"),
+        ("fire_resistance", "Wet Paddle Charm",
+         "Grants complete immunity to red fireball damage", 60, 1, "single"),
+    )),
+    ("Fortune", (
+        ("coin_multiplier", "Midas Touch",
+         "Temporarily double all coin drops for this wave", 80, 1, "consumable"),
+        ("time_slow", "Chronos Blessing",
+         "Slow down time for 10 seconds when activated", 95, 1, "consumable"),
+        ("lucky_charm", "Rabbit's Foot",
+         "Increase heart drop chance for this wave", 40, 1, "consumable"),
+        ("coin_boost", "Fortune's Favor",
+         "Increase coins earned per block destroyed", 70, 4, "tiered"),
+        ("lodestone_magnetism", "Lodestone Magnetism",
+         "Coins are attracted to balls from a distance (level 1), from even farther (level 2), and will drift toward balls automatically (level 3)", 55, 3, "tiered"),
+    )),
+    ("Potions", (
+        ("potion_widen", "Widen",
+         "Unlocks the chance to spawn a Widen potion (enlarges paddle on pickup)", 40, 1, "single"),
+        ("potion_sticky", "Sticky",
+         "Unlocks the chance to spawn a Sticky potion (balls stick to paddle until launched)", 35, 1, "single"),
+        ("potion_barrier", "Barrier",
+         "Unlocks the chance to spawn a Barrier potion (temporary shield around playfield)", 50, 1, "single"),
+        ("potion_pierce", "Pierce",
+         "Unlocks the chance to spawn a Pierce potion (balls pass through blocks)", 60, 1, "single"),
+        ("potion_through", "Alchemy",
+         "Unlocks the chance to spawn an Alchemy potion (converts regular cannonballs into potions or fireballs when hit by the paddle)", 55, 1, "single"),
+    )),
+)
+
+
 class Store:
-    """Main store interface with tabbed navigation."""
+    """Main store interface with tabbed navigation.
+
+    ``handle_event``, ``update`` and ``draw`` return immediately while the
+    store is closed; ``__slots__`` keeps that ``active`` check and the other
+    per-frame attribute reads off the instance dict.
+    """
+
+    __slots__ = ("active", "current_tab", "scroll_offset", "tab_names", "opened_automatically",
+                 "wave_number", "_upgrades_by_id", "game_state", "upgrades", "_current_list",
+                 "hover_item", "button_hover_states", "_nav_keys", "_resources_ready",
+                 "pixel_font_title", "pixel_font_large", "pixel_font_medium", "pixel_font_small",
+                 "_text_cache", "_instruction_surf", "_close_surf", "_tab_label_surfs", "feedback_msgs",
+                 "_p_xy", "_p_vel", "_p_life", "_p_count", "_overlay", "_particle_sprites",
+                 "_panel", "_panel_key", "_close_button_surf", "_dirty", "purchase_sound", "error_sound",
+                 "items_per_page", "_max_page_per_tab", "item_height", "selected_item", "_rows", "_row_bottoms", "_rows_key",
+                 "_store_rect", "_content_rect", "_tab_width", "_tab_rects", "_close_button_rect")
     
     def __init__(self):
         self.active = False
@@ -72,43 +255,102 @@ class Store:
         
         # Store state tracking
         self.wave_number = 1
-        self.player_upgrades = {}  # id -> current_level or purchase_count
         
         # Game state references for applying effects
         self.game_state = None
         
-        # Initialize all upgrades
+        # Initialize all upgrades (one list per tab) and the current tab's list
         self.upgrades = self._initialize_upgrades()
+        self._current_list = self.upgrades[self.current_tab]
+        
+        # id -> upgrade; an upgrade's current_level doubles as its purchase count
+        self._upgrades_by_id: Dict[str, StoreUpgrade] = {u.id: u for tab in self.upgrades for u in tab}
         
         # UI state
         self.hover_item = None
         self.button_hover_states = {}
         
+        # (previous tab, next tab, up, down) keys, resolved in open_store()
+        self._nav_keys: Tuple[int, int, int, int] = (0, 0, 0, 0)
+        
+        # Fonts, sounds and pre-rendered surfaces are created on the first
+        # open_store() (see _ensure_gpu_resources); the store is instantiated
+        # at import time and may never be opened in a session.
+        self._resources_ready = False
+        
         # Pixel font (PressStart2P)
-        self.pixel_font_title  = self._load_pixel_font(36)
-        self.pixel_font_large  = self._load_pixel_font(28)
-        self.pixel_font_medium = self._load_pixel_font(20)
-        self.pixel_font_small  = self._load_pixel_font(14)
+        self.pixel_font_title = None
+        self.pixel_font_large = None
+        self.pixel_font_medium = None
+        self.pixel_font_small = None
+        
+        # Rendered text surfaces keyed by (font id, text, color); see _render()
+        self._text_cache: Dict[Tuple[int, str, Tuple[int, ...]], pygame.Surface] = {}
+        self._instruction_surf: Optional[pygame.Surface] = None
+        self._close_surf: Optional[pygame.Surface] = None
+        self._tab_label_surfs: List[pygame.Surface] = []  # one per tab_names entry
         
         # Feedback messages (fading)
-        self.feedback_msgs = []  # list[dict{text,color,life,max_life}]
+        # deque[dict{surf,life,max_life}], oldest first; the oldest message is
+        # dropped once _FEEDBACK_MAX are showing
+        self.feedback_msgs: deque = deque(maxlen=_FEEDBACK_MAX)
+        
+        # Purchase effect particles as structure-of-arrays; rows [0, _p_count) are live
+        # (position and velocity in fixed point, see _PARTICLE_FRAC_BITS)
+        self._p_xy = np.zeros((_PARTICLE_CAPACITY, 2), dtype=np.int32)
+        self._p_vel = np.zeros((_PARTICLE_CAPACITY, 2), dtype=np.int32)
+        self._p_life = np.zeros(_PARTICLE_CAPACITY, dtype=np.int16)
+        self._p_count = 0
+        
+        # Dimming overlay and particle sprites
+        self._overlay: Optional[pygame.Surface] = None
+        self._particle_sprites: List[List[pygame.Surface]] = []  # [size][alpha bucket]
         
-        # Purchase effect particles
-        self.purchase_particles = []
+        # Snapshot of the store window (in window-local coordinates) and the
+        # state it shows, plus the never-changing close button
+        self._panel: Optional[pygame.Surface] = None
+        self._panel_key: Optional[Tuple] = None
+        self._close_button_surf: Optional[pygame.Surface] = None
+        self._dirty = True
         
         # Sound effects
         self.purchase_sound = None
         self.error_sound = None
-        self._load_sounds()
 
         # How many upgrade items fit on screen at once
         self.items_per_page = 3  # Fixed 3 items per page
+        
+        # Last page index of each tab (tab contents never change)
+        self._max_page_per_tab = [(len(tab) - 1) // self.items_per_page for tab in self.upgrades]
 
         # Visual tuning
         self.item_height = 80  # minimum vertical space per upgrade row
 
         # Track selected item for keyboard navigation
         self.selected_item = 0
+        
+        # Row layout of the visible page and the (tab, page) it was built for
+        self._rows: List[Tuple[StoreUpgrade, pygame.Rect, pygame.Rect, int]] = []
+        self._row_bottoms: List[int] = []
+        self._rows_key: Optional[Tuple[int, int]] = None
+        
+        # Fixed window, tab, content and close button rects
+        self._layout_rects()
+
+    def _layout_rects(self):
+        """Precompute the store's static layout rects shared by drawing and hit-testing.
+
+        The layout is fixed to the config resolution (``WIDTH``/``HEIGHT``),
+        so this runs once from ``__init__``.
+        """
+        store_rect = pygame.Rect(WIDTH // 8, HEIGHT // 6, WIDTH * 3 // 4, HEIGHT * 2 // 3)
+        self._store_rect = store_rect
+        self._content_rect = pygame.Rect(store_rect.x + 20, store_rect.y + 140,
+                                         store_rect.width - 40, store_rect.height - 200)
+        self._tab_width = store_rect.width // len(self.tab_names)
+        self._tab_rects = [pygame.Rect(store_rect.x + i * self._tab_width, store_rect.y + 80, self._tab_width, 40)
+                           for i in range(len(self.tab_names))]
+        self._close_button_rect = pygame.Rect(WIDTH - 100, 50, 80, 40)
 
     def _load_sounds(self):
         """Load store sound effects."""
@@ -123,93 +365,132 @@ class Store:
             # Volume will be set by options menu
         except pygame.error:
             pass
+        
+        # Pick up the current settings; later changes arrive via on_options_changed()
+        self._update_sound_volumes()
     
     def _update_sound_volumes(self):
-        """Update store sound volumes based on current settings."""
+        """Apply the options menu's current SFX settings, if it exists yet."""
         try:
             import sys
             if '__main__' in sys.modules and hasattr(sys.modules['__main__'], 'options_menu'):
                 options_menu = sys.modules['__main__'].options_menu
                 if hasattr(options_menu, 'settings'):
-                    if options_menu.settings.get('sfx_muted', False):
-                        if self.purchase_sound:
-                            self.purchase_sound.set_volume(0)
-                        if self.error_sound:
-                            self.error_sound.set_volume(0)
-                    else:
-                        sfx_vol = options_menu.settings.get('sfx_volume', 0.75)
-                        if self.purchase_sound:
-                            self.purchase_sound.set_volume(sfx_vol)
-                        if self.error_sound:
-                            self.error_sound.set_volume(sfx_vol * 0.5)  # Error sound is quieter
+                    self.on_options_changed(options_menu.settings)
         except Exception as e:
             print(f"[Store] Failed to update sound volumes: {e}")
 
+    def on_options_changed(self, settings: Dict[str, Any]):
+        """Update store sound volumes from the options menu *settings*.
+
+        Called by the options menu whenever settings are applied, so the
+        purchase path can play sounds without looking volumes up.
+        """
+        if settings.get('sfx_muted', False):
+            if self.purchase_sound:
+                self.purchase_sound.set_volume(0)
+            if self.error_sound:
+                self.error_sound.set_volume(0)
+        else:
+            sfx_vol = settings.get('sfx_volume', 0.75)
+            if self.purchase_sound:
+                self.purchase_sound.set_volume(sfx_vol)
+            if self.error_sound:
+                self.error_sound.set_volume(sfx_vol * 0.5)  # Error sound is quieter
+
+    def _render(self, font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+        """Render *text* through the text cache; returned surfaces are shared and read-only."""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= _TEXT_CACHE_MAX:
+                # Drop the oldest entry (dicts keep insertion order)
+                del self._text_cache[next(iter(self._text_cache))]
+            surf = font.render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
     def _load_pixel_font(self, size: int):
         """Load bundled PressStart2P font or fallback to monospace."""
         from utils import load_font
         return load_font('PressStart2P-Regular.ttf', size)
 
-    def _initialize_upgrades(self) -> Dict[str, List[StoreUpgrade]]:
-        """Create all store upgrades organized by category."""
-        upgrades = {
-            "Restoration": [
-                StoreUpgrade("paddle_heal", "Healer's Balm", 
-                           "Restore your paddle to full length", 15, 1, "consumable"),
-                StoreUpgrade("wall_repair", "Stone Mason's Kit", 
-                           "Repair damaged castle wall blocks", 25, 1, "consumable"),
-                StoreUpgrade("repair_drone", "Golem Servant", 
-                           "Deploy an automaton that slowly repairs wall damage", 120, 1, "single"),
-                StoreUpgrade("emergency_heal", "Angel's Grace", 
-                           "Automatically heal when paddle becomes critically small", 90, 2, "tiered"),
-            ],
-            "Upgrades": [
-                StoreUpgrade("fortified_walls", "Fortified Walls", 
-                           "Upgrade your castle wall to reinforced (level 1) and then fortress grade (level 2)", 60, 2, "tiered"),
-                StoreUpgrade("paddle_width", "Giant's Grip", 
-                           "Permanently widen your paddle for better deflection", 50, 5, "tiered"),
-                StoreUpgrade("paddle_agility", "Wind Walker's Grace", 
-                           "Reduce paddle inertia for snappier movement", 45, 3, "tiered"),
-                StoreUpgrade("fire_resistance", "Wet Paddle Charm", 
-                           "Grants complete immunity to red fireball damage", 60, 1, "single"),
-            ],
-            "Fortune": [
-                StoreUpgrade("coin_multiplier", "Midas Touch", 
-                           "Temporarily double all coin drops for this wave", 80, 1, "consumable"),
-                StoreUpgrade("time_slow", "Chronos Blessing", 
-                           "Slow down time for 10 seconds when activated", 95, 1, "consumable"),
-                StoreUpgrade("lucky_charm", "Rabbit's Foot", 
-                           "Increase heart drop chance for this wave", 40, 1, "consumable"),
-                StoreUpgrade("coin_boost", "Fortune's Favor", 
-                           "Increase coins earned per block destroyed", 70, 4, "tiered"),
-                StoreUpgrade("lodestone_magnetism", "Lodestone Magnetism", 
-                           "Coins are attracted to balls from a distance (level 1), from even farther (level 2), and will drift toward balls automatically (level 3)", 55, 3, "tiered"),
-            ],
-            "Potions": [
-                StoreUpgrade("potion_widen", "Widen", 
-                           "Unlocks the chance to spawn a Widen potion (enlarges paddle on pickup)", 40, 1, "single"),
-                StoreUpgrade("potion_sticky", "Sticky", 
-                           "Unlocks the chance to spawn a Sticky potion (balls stick to paddle until launched)", 35, 1, "single"),
-                StoreUpgrade("potion_barrier", "Barrier", 
-                           "Unlocks the chance to spawn a Barrier potion (temporary shield around playfield)", 50, 1, "single"),
-                StoreUpgrade("potion_pierce", "Pierce", 
-                           "Unlocks the chance to spawn a Pierce potion (balls pass through blocks)", 60, 1, "single"),
-                StoreUpgrade("potion_through", "Alchemy", 
-                           "Unlocks the chance to spawn an Alchemy potion (converts regular cannonballs into potions or fireballs when hit by the paddle)", 55, 1, "single"),
-            ]
-        }
-        self.tab_names = ["Restoration", "Upgrades", "Fortune", "Potions"]
-        return upgrades
+    def _initialize_upgrades(self) -> List[List[StoreUpgrade]]:
+        """Create all store upgrades organized by category.
+
+        Returns one list per tab, indexed like ``self.tab_names``.
+        """
+        self.tab_names = [tab for tab, _ in _UPGRADE_CATALOG]
+        return [[StoreUpgrade(*spec) for spec in specs] for _, specs in _UPGRADE_CATALOG]
 
     def open_store(self, wave_number: int, automatic: bool = False):
         """Open the store interface."""
         self.active = True
         self.wave_number = wave_number
         self.current_tab = 0
+        self._current_list = self.upgrades[0]
         self.scroll_offset = 0
         self.selected_item = 0
         self.hover_item = None
         self.opened_automatically = automatic
+        
+        # Controls can only be rebound from the options menu, never while
+        # the store is open, so resolve the navigation keys once per opening
+        self._nav_keys = (get_control_key('bottom_paddle_left'), get_control_key('bottom_paddle_right'),
+                          get_control_key('right_paddle_up'), get_control_key('right_paddle_down'))
+        
+        self._ensure_gpu_resources()
+        self._dirty = True
+
+    def _ensure_gpu_resources(self):
+        """Load fonts and sounds and build the cached surfaces, once."""
+        if self._resources_ready:
+            return
+        
+        self.pixel_font_title  = self._load_pixel_font(36)
+        self.pixel_font_large  = self._load_pixel_font(28)
+        self.pixel_font_medium = self._load_pixel_font(20)
+        self.pixel_font_small  = self._load_pixel_font(14)
+        self._load_sounds()
+        
+        self._instruction_surf = self._render(self.pixel_font_small, "Arrow Keys to Navigate | Spacebar to Buy", (200, 200, 200))
+        self._close_surf = self._render(self.pixel_font_small, "CLOSE", (255, 255, 255))
+        self._tab_label_surfs = [self._render(self.pixel_font_medium, name, (255, 255, 255))
+                                 for name in self.tab_names]
+        
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        self._overlay = overlay.convert_alpha()
+        self._build_particle_sprites()
+        self._panel = pygame.Surface(self._store_rect.size).convert()
+        self._close_button_surf = self._build_close_button()
+        
+        self._resources_ready = True
+
+    def _build_close_button(self) -> pygame.Surface:
+        """Pre-render the close button, which never changes."""
+        button = pygame.Surface(self._close_button_rect.size)
+        rect = button.get_rect()
+        pygame.draw.rect(button, (150, 50, 50), rect)
+        pygame.draw.rect(button, (255, 255, 255), rect, 2)
+        button.blit(self._close_surf, self._close_surf.get_rect(center=rect.center))
+        return button.convert()
+
+    def _build_particle_sprites(self):
+        """Pre-bake purchase particle circles, indexed [size][alpha // _PARTICLE_ALPHA_STEP].
+
+        Row 0 is unused so sizes 1-4 index directly.
+        """
+        self._particle_sprites = [[]]
+        for size in range(1, 5):
+            row = []
+            for alpha in range(0, 256, _PARTICLE_ALPHA_STEP):
+                sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, (*_PARTICLE_COLOR, alpha), (size, size), size)
+                row.append(sprite.convert_alpha())
+            self._particle_sprites.append(row)
 
     def close_store(self):
         """Close the store interface."""
@@ -239,39 +520,39 @@ class Store:
             return False
         
         if event.type == pygame.KEYDOWN:
+            key_prev_tab, key_next_tab, key_up, key_down = self._nav_keys
             if event.key == pygame.K_ESCAPE:
                 self.close_store()
                 return True
-            elif event.key == get_control_key('bottom_paddle_left'):
+            elif event.key == key_prev_tab:
                 self.current_tab = (self.current_tab - 1) % len(self.tab_names)
+                self._current_list = self.upgrades[self.current_tab]
                 self.scroll_offset = 0
                 self.selected_item = 0
                 return True
-            elif event.key == get_control_key('bottom_paddle_right'):
+            elif event.key == key_next_tab:
                 self.current_tab = (self.current_tab + 1) % len(self.tab_names)
+                self._current_list = self.upgrades[self.current_tab]
                 self.scroll_offset = 0
                 self.selected_item = 0
                 return True
-            elif event.key == get_control_key('right_paddle_up'):
+            elif event.key == key_up:
                 if self.selected_item > 0:
                     self.selected_item -= 1
                 else:
-                    current_upgrades = self.upgrades[self.tab_names[self.current_tab]]
                     if self.scroll_offset > 0:
                         self.scroll_offset -= 1
                         self.selected_item = self.items_per_page - 1
                     else:
-                        max_pages = (len(current_upgrades) - 1) // self.items_per_page
+                        max_pages = self._max_page_per_tab[self.current_tab]
                         self.scroll_offset = max_pages
-                        self.selected_item = min(self.items_per_page - 1, len(current_upgrades) - 1 - (max_pages * self.items_per_page))
+                        self.selected_item = min(self.items_per_page - 1, len(self._current_list) - 1 - (max_pages * self.items_per_page))
                 return True
-            elif event.key == get_control_key('right_paddle_down'):
-                current_upgrades = self.upgrades[self.tab_names[self.current_tab]]
-                if self.selected_item < min(self.items_per_page - 1, len(current_upgrades) - 1 - (self.scroll_offset * self.items_per_page)):
+            elif event.key == key_down:
+                if self.selected_item < min(self.items_per_page - 1, len(self._current_list) - 1 - (self.scroll_offset * self.items_per_page)):
                     self.selected_item += 1
                 else:
-                    max_pages = (len(current_upgrades) - 1) // self.items_per_page
-                    if self.scroll_offset < max_pages:
+                    if self.scroll_offset < self._max_page_per_tab[self.current_tab]:
                         self.scroll_offset += 1
                         self.selected_item = 0
                     else:
@@ -279,45 +560,24 @@ class Store:
                         self.selected_item = 0
                 return True
             elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                # Attempt to purchase selected item
-                current_upgrades = self.upgrades[self.tab_names[self.current_tab]]
-                start_index = self.scroll_offset * self.items_per_page
-                item_index = start_index + self.selected_item
-                
-                if 0 <= item_index < len(current_upgrades):
-                    upgrade = current_upgrades[item_index]
+                # Attempt to purchase selected item (rows of the visible page)
+                rows = self._visible_rows()
+                if self.selected_item < len(rows):
+                    upgrade, _, buy_button_rect, _ = rows[self.selected_item]
                     if upgrade.can_purchase():
                         if upgrade.purchase():
                             self._apply_upgrade_effect(upgrade)
-                            # Find the item_rect for the selected item to spawn particles
-                            store_rect = pygame.Rect(WIDTH // 8, HEIGHT // 6, WIDTH * 3 // 4, HEIGHT * 2 // 3)
-                            content_rect = pygame.Rect(store_rect.x + 20, store_rect.y + 140, store_rect.width - 40, store_rect.height - 200)
-                            
-                            # Calculate the position of the selected item
-                            current_y = content_rect.y
-                            for i in range(self.selected_item):
-                                # Calculate item height for the item at this position
-                                item = current_upgrades[start_index + i]
-                                desc_lines = self._wrap_text(self.pixel_font_small, item.description, content_rect.width - 200)
-                                desc_height = len(desc_lines) * 18
-                                required_height = 8 + 30 + desc_height + 12 + 20 + 10
-                                item_height = required_height
-                                current_y += item_height
-                            
-                            buy_button_rect = pygame.Rect(content_rect.right - 100, current_y + 5, 90, 30)
+                            # Spawn particles from the selected item's buy button
                             self._create_purchase_particles(buy_button_rect.center)
                             if self.purchase_sound:
-                                self._update_sound_volumes()
                                 self.purchase_sound.play()
                             self._add_feedback("Purchased!", (80, 200, 80))
                         else:
                             if self.error_sound:
-                                self._update_sound_volumes()
                                 self.error_sound.play()
                             self._add_feedback("Not enough coins!", (220, 80, 80))
                     else:
                         if self.error_sound:
-                            self._update_sound_volumes()
                             self.error_sound.play()
                         self._add_feedback("Cannot purchase!", (220, 80, 80))
                 return True
@@ -335,9 +595,7 @@ class Store:
                 self.scroll_offset = max(0, self.scroll_offset - 1)
                 self.selected_item = 0
             elif event.y < 0:
-                current_upgrades = self.upgrades[self.tab_names[self.current_tab]]
-                max_pages = (len(current_upgrades) - 1) // self.items_per_page
-                self.scroll_offset = min(max_pages, self.scroll_offset + 1)
+                self.scroll_offset = min(self._max_page_per_tab[self.current_tab], self.scroll_offset + 1)
                 self.selected_item = 0
             return True
         
@@ -347,48 +605,24 @@ class Store:
         """Handle mouse clicks in the store."""
         mouse_x, mouse_y = pos
         
-        # Calculate the same rect values that are used inside the draw() method so
-        # the clickable areas line-up perfectly with what the player sees.
-        store_rect = pygame.Rect(WIDTH // 8, HEIGHT // 6, WIDTH * 3 // 4, HEIGHT * 2 // 3)
-        tab_y = store_rect.y + 80  # matches _draw_tabs()
-        tab_height = 40
-        tab_width = store_rect.width // len(self.tab_names)
-        
-        # Check tab clicks
-        for i, _ in enumerate(self.tab_names):
-            tab_x = store_rect.x + i * tab_width
-            if tab_x <= mouse_x <= tab_x + tab_width and tab_y <= mouse_y <= tab_y + tab_height:
+        # The same rects are used by draw(), so the clickable areas line-up
+        # perfectly with what the player sees.
+        store_rect = self._store_rect
+        
+        # Check tab clicks (edges inclusive)
+        for i, tab_rect in enumerate(self._tab_rects):
+            if tab_rect.left <= mouse_x <= tab_rect.right and tab_rect.top <= mouse_y <= tab_rect.bottom:
                 self.current_tab = i
+                self._current_list = self.upgrades[i]
                 self.scroll_offset = 0
                 return True
         
         # Check upgrade purchase clicks
         if store_rect.collidepoint(pos):
-            # Recreate the content_rect used in drawing to ensure hitboxes match visuals
-            content_rect = pygame.Rect(store_rect.x + 20, store_rect.y + 140,
-                                      store_rect.width - 40, store_rect.height - 200)
-
-            current_upgrades = self.upgrades[self.tab_names[self.current_tab]]
-            
-            # Fixed pagination: show exactly 3 items per page
-            start_index = self.scroll_offset * self.items_per_page
-            end_index = min(start_index + self.items_per_page, len(current_upgrades))
-            items_to_show = current_upgrades[start_index:end_index]
-            
-            # Calculate item heights for the items we're showing
-            item_heights = []
-            for upgrade in items_to_show:
-                desc_lines = self._wrap_text(self.pixel_font_small, upgrade.description, content_rect.width - 200)
-                desc_height = len(desc_lines) * 18  # 18px per line
-                required_height = 8 + 30 + desc_height + 12 + 20 + 10
-                item_heights.append(required_height)
-
-            # Check buy button clicks
-            current_y = content_rect.y
-            for i, upgrade in enumerate(items_to_show):
-                item_height = item_heights[i]
-                buy_button_rect = pygame.Rect(content_rect.right - 100, current_y + 5, 90, 30)
-
+            # Check the buy button of the row under the cursor
+            row = self._row_at(mouse_y)
+            if row >= 0:
+                upgrade, _, buy_button_rect, _ = self._rows[row]
                 if buy_button_rect.collidepoint(pos) and upgrade.can_purchase():
                     if upgrade.purchase():
                         self._apply_upgrade_effect(upgrade)
@@ -402,12 +636,9 @@ class Store:
                             self.error_sound.play()
                         self._add_feedback("Not enough coins!", (220, 80, 80))
                         return True
-                
-                current_y += item_height
         
         # Check close button
-        close_button = pygame.Rect(WIDTH - 100, 50, 80, 40)
-        if close_button.collidepoint(pos):
+        if self._close_button_rect.collidepoint(pos):
             self.close_store()
             return True
         
@@ -419,40 +650,27 @@ class Store:
         self.hover_item = None
         
         # Check upgrade hover
-        store_rect = pygame.Rect(WIDTH // 8, HEIGHT // 6, WIDTH * 3 // 4, HEIGHT * 2 // 3)
-        content_rect = pygame.Rect(store_rect.x + 20, store_rect.y + 140,
-                                   store_rect.width - 40, store_rect.height - 200)
-        if content_rect.collidepoint(pos):
-            current_upgrades = self.upgrades[self.tab_names[self.current_tab]]
-            
-            # Fixed pagination: show exactly 3 items per page
-            start_index = self.scroll_offset * self.items_per_page
-            end_index = min(start_index + self.items_per_page, len(current_upgrades))
-            items_to_show = current_upgrades[start_index:end_index]
-            
-            # Calculate item heights for the items we're showing
-            item_heights = []
-            for upgrade in items_to_show:
-                desc_lines = self._wrap_text(self.pixel_font_small, upgrade.description, content_rect.width - 200)
-                desc_height = len(desc_lines) * 18  # 18px per line
-                required_height = 8 + 30 + desc_height + 12 + 20 + 10
-                item_heights.append(required_height)
-            
-            # Check hover on items
-            current_y = content_rect.y
-            for i, upgrade in enumerate(items_to_show):
-                item_height = item_heights[i]
-                if current_y <= mouse_y <= current_y + item_height:
-                    self.hover_item = upgrade
-                    break
-                current_y += item_height
+        if self._content_rect.collidepoint(pos):
+            row = self._row_at(mouse_y)
+            if row >= 0:
+                self.hover_item = self._rows[row][0]
+
+    def _row_at(self, y: int) -> int:
+        """Return the index of the visible row under screen y, or -1.
+
+        A row spans its full height including the gap below it, edges
+        inclusive; where two rows touch, the upper one wins.
+        """
+        rows = self._visible_rows()
+        i = bisect_left(self._row_bottoms, y)
+        if i < len(rows) and rows[i][1].top <= y:
+            return i
+        return -1
 
     def _apply_upgrade_effect(self, upgrade: StoreUpgrade):
         """Apply the effect of a purchased upgrade to the game."""
-        # Track the purchase
-        if upgrade.id not in self.player_upgrades:
-            self.player_upgrades[upgrade.id] = 0
-        self.player_upgrades[upgrade.id] += 1
+        # The purchase itself is tracked on the upgrade (current_level)
+        self._dirty = True
         
         # Apply specific upgrade effects immediately if we have game state
         if self.game_state:
@@ -468,7 +686,7 @@ class Store:
                 elif upgrade.upgrade_type == "single":
                     apply_single_upgrades(self, upgrade.id, paddles, player_wall, castle)
                 elif upgrade.upgrade_type == "tiered":
-                    level = self.player_upgrades[upgrade.id]
+                    level = upgrade.current_level
                     apply_tiered_upgrades(self, upgrade.id, level, paddles, player_wall, castle)
                     
             except ImportError:
@@ -476,22 +694,18 @@ class Store:
 
     def _create_purchase_particles(self, center: Tuple[int, int]):
         """Create particle effect for successful purchase."""
-        for _ in range(15):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            particle = {
-                'x': center[0] + random.uniform(-10, 10),
-                'y': center[1] + random.uniform(-10, 10),
-                'vel_x': vel_x,
-                'vel_y': vel_y,
-                'life': 60,
-                'max_life': 60,
-                'color': (255, 215, 0)  # gold
-            }
-            self.purchase_particles.append(particle)
+        n = _PARTICLE_BURST
+        start = self._p_count
+        if start + n > _PARTICLE_CAPACITY:
+            # Full: drop the oldest particles to make room
+            keep = _PARTICLE_CAPACITY - n
+            self._p_xy[:keep] = self._p_xy[start - keep:start]
+            self._p_vel[:keep] = self._p_vel[start - keep:start]
+            self._p_life[:keep] = self._p_life[start - keep:start]
+            start = keep
+        end = start + n
+        _spawn_particles(self._p_xy[start:end], self._p_vel[start:end], self._p_life[start:end], center)
+        self._p_count = end
 
     def update(self, dt_ms: int):
         """Update store animations and effects."""
@@ -499,91 +713,103 @@ class Store:
             return
         
         # Update purchase particles
-        for particle in self.purchase_particles[:]:
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['vel_y'] += 0.2  # gravity
-            particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.purchase_particles.remove(particle)
+        if self._p_count:
+            self._p_count = _advance_particles(self._p_xy, self._p_vel, self._p_life, self._p_count)
 
-        # Update feedback messages
-        for msg in self.feedback_msgs[:]:
-            msg['life'] -= 1
-            if msg['life'] <= 0:
-                self.feedback_msgs.remove(msg)
+        # Update feedback messages.  All messages share one lifetime, so they
+        # expire oldest-first and only the front of the queue needs checking.
+        feedback = self.feedback_msgs
+        if feedback:
+            for msg in feedback:
+                msg['life'] -= 1
+            while feedback and feedback[0]['life'] <= 0:
+                feedback.popleft()
 
     def draw(self, screen: pygame.Surface):
-        """Draw the store interface."""
+        """Draw the store interface.
+
+        The store window is composed into a snapshot that is only redrawn
+        when something it shows changes (see ``_compose_panel``); the close
+        button is pre-rendered, and feedback messages and particles are drawn
+        on top every frame.
+        """
         if not self.active:
             return
         
         # Semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay, (0, 0))
         
+        # Store window from the snapshot, recomposed when the balance, wave,
+        # tab, page, selection or hover changed since last frame (purchases
+        # also set _dirty explicitly)
+        store_rect = self._store_rect
+        coins = coin.get_coin_count()
+        key = (coins, self.wave_number, self.current_tab, self.scroll_offset, self.selected_item, self.hover_item)
+        if self._dirty or key != self._panel_key:
+            self._compose_panel(self._panel, coins)
+            self._panel_key = key
+            self._dirty = False
+        screen.blits([(self._panel, store_rect),
+                      (self._close_button_surf, self._close_button_rect)], doreturn=False)
+        
+        # Draw feedback messages (fade out)
+        for idx, msg in enumerate(self.feedback_msgs):
+            alpha = 255 * msg['life'] // msg['max_life']
+            txt_surf = msg['surf']
+            txt_surf.set_alpha(alpha)
+            txt_rect = txt_surf.get_rect(center=(WIDTH // 2, store_rect.bottom - 70 - idx * 30))
+            screen.blit(txt_surf, txt_rect)
+        
+        # Purchase particles, blitted from the pre-baked sprite atlas
+        n = self._p_count
+        if n:
+            life = self._p_life[:n].astype(np.int32)
+            sizes = np.maximum(1, 4 * life // _PARTICLE_LIFE).tolist()
+            buckets = (255 * life // _PARTICLE_LIFE // _PARTICLE_ALPHA_STEP).tolist()
+            positions = (self._p_xy[:n] >> _PARTICLE_FRAC_BITS).tolist()
+            sprites = self._particle_sprites
+            screen.blits([(sprites[size][bucket], (x - size, y - size))
+                          for (x, y), size, bucket in zip(positions, sizes, buckets)], doreturn=False)
+
+    def _compose_panel(self, panel: pygame.Surface, coins: int):
+        """Draw the store window onto *panel*, whose origin is the window's top-left."""
         # Main store window
-        store_rect = pygame.Rect(WIDTH // 8, HEIGHT // 6, WIDTH * 3 // 4, HEIGHT * 2 // 3)
-        pygame.draw.rect(screen, (40, 40, 60), store_rect)
-        pygame.draw.rect(screen, (255, 255, 255), store_rect, 3)
+        store_rect = self._store_rect
+        ox, oy = store_rect.topleft
+        window = panel.get_rect()
+        pygame.draw.rect(panel, (40, 40, 60), window)
+        pygame.draw.rect(panel, (255, 255, 255), window, 3)
         
         # Title
-        title_text = self.pixel_font_title.render(f"SHOP - Wave {self.wave_number}", True, (255, 215, 0))
-        title_rect = title_text.get_rect(center=(WIDTH // 2, store_rect.y + 30))
-        screen.blit(title_text, title_rect)
+        title_text = self._render(self.pixel_font_title, f"SHOP - Wave {self.wave_number}", (255, 215, 0))
+        title_rect = title_text.get_rect(center=(WIDTH // 2 - ox, 30))
         
         # Coin display
-        coin_text = self.pixel_font_medium.render(f"Coins: {coin.get_coin_count()}", True, (255, 215, 0))
-        screen.blit(coin_text, (store_rect.x + 20, store_rect.y + 60))
+        coin_text = self._render(self.pixel_font_medium, f"Coins: {coins}", (255, 215, 0))
+        
+        # Tab backgrounds (labels are returned for the batch below)
+        tab_labels = self._draw_tabs(panel, ox, oy)
         
-        # Tabs
-        self._draw_tabs(screen, store_rect)
+        # Static chrome text in one batched call; none of these overlap
+        panel.blits([(title_text, title_rect),
+                     (coin_text, (20, 60)),
+                     *tab_labels], doreturn=False)
         
         # Current tab content
-        self._draw_tab_content(screen, store_rect)
+        self._draw_tab_content(panel, coins, ox, oy)
         
         # Instructions
-        instruction_font = self.pixel_font_small
-        instruction_text = instruction_font.render("Arrow Keys to Navigate | Spacebar to Buy", True, (200, 200, 200))
-        screen.blit(instruction_text, (store_rect.x + 20, store_rect.bottom - 40))
-        
-        # Draw feedback messages (fade out)
-        for idx, msg in enumerate(self.feedback_msgs):
-            alpha = int(255 * (msg['life'] / msg['max_life']))
-            txt_surf = self.pixel_font_medium.render(msg['text'], True, msg['color'])
-            txt_surf.set_alpha(alpha)
-            txt_rect = txt_surf.get_rect(center=(WIDTH // 2, store_rect.bottom - 70 - idx * 30))
-            screen.blit(txt_surf, txt_rect)
+        panel.blit(self._instruction_surf, (20, window.bottom - 40))
+
+    def _draw_tabs(self, screen: pygame.Surface, ox: int, oy: int) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Draw the tab navigation backgrounds and return the label blits.
+
+        *ox*, *oy* is the screen position of *screen*'s origin.
+        """
+        labels = []
         
-        # Close button
-        close_button = pygame.Rect(WIDTH - 100, 50, 80, 40)
-        pygame.draw.rect(screen, (150, 50, 50), close_button)
-        pygame.draw.rect(screen, (255, 255, 255), close_button, 2)
-        close_text = self.pixel_font_small.render("CLOSE", True, (255, 255, 255))
-        close_rect = close_text.get_rect(center=close_button.center)
-        screen.blit(close_text, close_rect)
-        
-        # Purchase particles
-        for particle in self.purchase_particles:
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            color = (*particle['color'], alpha)
-            size = max(1, int(4 * (particle['life'] / particle['max_life'])))
-            
-            particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, color, (size, size), size)
-            screen.blit(particle_surf, (particle['x'] - size, particle['y'] - size))
-
-    def _draw_tabs(self, screen: pygame.Surface, store_rect: pygame.Rect):
-        """Draw the tab navigation."""
-        tab_y = store_rect.y + 80
-        tab_width = store_rect.width // len(self.tab_names)
-        tab_font = self.pixel_font_medium
-        
-        for i, tab_name in enumerate(self.tab_names):
-            tab_x = store_rect.x + i * tab_width
-            tab_rect = pygame.Rect(tab_x, tab_y, tab_width, 40)
+        for i, tab_text in enumerate(self._tab_label_surfs):
+            tab_rect = self._tab_rects[i].move(-ox, -oy)
             
             # Tab background
             if i == self.current_tab:
@@ -593,90 +819,134 @@ class Store:
             
             pygame.draw.rect(screen, (255, 255, 255), tab_rect, 2)
             
-            # Tab text
-            tab_text = tab_font.render(tab_name, True, (255, 255, 255))
-            tab_text_rect = tab_text.get_rect(center=tab_rect.center)
-            screen.blit(tab_text, tab_text_rect)
-
-    def _draw_tab_content(self, screen: pygame.Surface, store_rect: pygame.Rect):
-        """Draw the content of the current tab."""
-        content_rect = pygame.Rect(store_rect.x + 20, store_rect.y + 140, 
-                                 store_rect.width - 40, store_rect.height - 200)
-        
-        current_upgrades = self.upgrades[self.tab_names[self.current_tab]]
-        
-        # Fixed pagination: show exactly 3 items per page
-        start_index = self.scroll_offset * self.items_per_page
-        end_index = min(start_index + self.items_per_page, len(current_upgrades))
-        items_to_show = current_upgrades[start_index:end_index]
-        
-        # Calculate item heights for the items we're showing
-        item_heights = []
-        for upgrade in items_to_show:
-            desc_lines = self._wrap_text(self.pixel_font_small, upgrade.description, content_rect.width - 200)
-            desc_height = len(desc_lines) * 18  # 18px per line
-            # Base height: 8 (name) + 30 (spacing) + desc_height + 12 (spacing) + 20 (level) + 10 (padding)
-            required_height = 8 + 30 + desc_height + 12 + 20 + 10
-            item_heights.append(required_height)
-        
-        # Draw upgrades with calculated heights
-        current_y = content_rect.y
-        for i, upgrade in enumerate(items_to_show):
-            item_height = item_heights[i]
-            item_rect = pygame.Rect(content_rect.x, current_y, content_rect.width, item_height - 5)
-            
-            # Item background
-            if upgrade == self.hover_item or i == self.selected_item:
-                pygame.draw.rect(screen, (100, 100, 140), item_rect)
-                pygame.draw.rect(screen, (255, 215, 0), item_rect, 3)  # gold border for selected
-            else:
-                pygame.draw.rect(screen, (50, 50, 70), item_rect)
+            # Tab text (pre-rendered in _ensure_gpu_resources)
+            labels.append((tab_text, tab_text.get_rect(center=tab_rect.center)))
+        
+        return labels
+
+    def _visible_rows(self) -> List[Tuple[StoreUpgrade, pygame.Rect, pygame.Rect, int]]:
+        """Return (upgrade, item_rect, buy_button_rect, item_height) for each row on the current page.
+
+        Row heights depend only on the wrapped descriptions, so the layout is
+        cached until the tab or page changes.  Drawing and hit-testing share
+        it; the rects must not be modified.
+        """
+        key = (self.current_tab, self.scroll_offset)
+        if self._rows_key != key:
+            content_rect = self._content_rect
             
-            pygame.draw.rect(screen, (255, 255, 255), item_rect, 1)
+            # Fixed pagination: show exactly 3 items per page
+            start_index = self.scroll_offset * self.items_per_page
+            items_to_show = self._current_list[start_index:start_index + self.items_per_page]
             
-            # Item details
-            self._draw_upgrade_item(screen, item_rect, upgrade)
+            rows = []
+            current_y = content_rect.y
+            for upgrade in items_to_show:
+                item_height = self._item_height(upgrade, content_rect.width)
+                item_rect = pygame.Rect(content_rect.x, current_y, content_rect.width, item_height - 5)
+                buy_button_rect = pygame.Rect(content_rect.right - 100, current_y + 5, 90, 30)
+                rows.append((upgrade, item_rect, buy_button_rect, item_height))
+                current_y += item_height
             
-            current_y += item_height
+            self._rows = rows
+            self._row_bottoms = [item_rect.top + item_height for _, item_rect, _, item_height in rows]
+            self._rows_key = key
+        return self._rows
+
+    def _item_height(self, upgrade: StoreUpgrade, content_width: int) -> int:
+        """Return the row height for *upgrade*, wrapping its description once per width."""
+        layout = upgrade._layout
+        if layout is None or layout[0] != content_width:
+            desc_lines = self._wrap_text(self.pixel_font_small, upgrade.description, content_width - 200)
+            desc_height = len(desc_lines) * 18  # 18px per line
+            # Base height: 8 (name) + 30 (spacing) + desc_height + 12 (spacing) + 20 (level) + 10 (padding)
+            layout = upgrade._layout = (content_width, 8 + 30 + desc_height + 12 + 20 + 10)
+        return layout[1]
+
+    def _draw_tab_content(self, screen: pygame.Surface, coins: int, ox: int, oy: int):
+        """Draw the content of the current tab.
+
+        *ox*, *oy* is the screen position of *screen*'s origin.
+        """
+        content_rect = self._content_rect.move(-ox, -oy)
+        rows = self._visible_rows()
+        
+        # Upgrade rows (background and details pre-composited), batched below
+        blit_seq = []
+        for i, (upgrade, item_rect, _, _) in enumerate(rows):
+            highlighted = upgrade == self.hover_item or i == self.selected_item
+            blit_seq.append((self._upgrade_row_surface(upgrade, item_rect, highlighted, coins),
+                             (item_rect.x - ox, item_rect.y - oy)))
         
         # Scroll indicators with item ranges
-        total_items = len(current_upgrades)
+        total_items = len(self._current_list)
         if total_items > 0:
+            start_index = self.scroll_offset * self.items_per_page
             start_item = start_index + 1
-            end_item = end_index
+            end_item = start_index + len(rows)
             
             # Always show the current range below the last visible item
             range_text = f"{start_item} - {end_item} of {total_items}"
-            range_text_surface = self.pixel_font_small.render(range_text, True, (200, 200, 200))
+            range_text_surface = self._render(self.pixel_font_small, range_text, (200, 200, 200))
             # Position below the last visible item
-            last_item_bottom = current_y
-            screen.blit(range_text_surface, (content_rect.centerx - range_text_surface.get_width()//2, last_item_bottom + 10))
+            last_item_bottom = rows[-1][1].top - oy + rows[-1][3] if rows else content_rect.y
+            blit_seq.append((range_text_surface, (content_rect.centerx - range_text_surface.get_width()//2, last_item_bottom + 10)))
+        
+        screen.blits(blit_seq, doreturn=False)
 
-    def _draw_upgrade_item(self, screen: pygame.Surface, item_rect: pygame.Rect, upgrade: StoreUpgrade):
-        """Draw a single upgrade item."""
-        # Draw a single upgrade row (icon, name, description, cost, buy button)
+    def _upgrade_row_surface(self, upgrade: StoreUpgrade, item_rect: pygame.Rect,
+                             highlighted: bool, coins: int) -> pygame.Surface:
+        """Return the drawn row for a single upgrade item.
+
+        The row is composited once into ``upgrade._cached_surface`` and only
+        redrawn when something it shows changes (highlight, purchase state,
+        level or affordability).  *coins* is the player's balance, read once
+        per frame by the caller.
+        """
+        can_afford = upgrade.can_purchase() and coins >= upgrade.get_current_cost()
+        key = (item_rect.size, highlighted, upgrade.purchased, upgrade.current_level, can_afford)
+        if upgrade._cached_key != key:
+            row = pygame.Surface(item_rect.size)
+            self._compose_upgrade_row(row, upgrade, highlighted, can_afford)
+            upgrade._cached_surface = row.convert()
+            upgrade._cached_key = key
+        return upgrade._cached_surface
+
+    def _compose_upgrade_row(self, row: pygame.Surface, upgrade: StoreUpgrade, highlighted: bool, can_afford: bool):
+        """Draw an upgrade row's background and details onto *row* at the origin."""
+        rect = row.get_rect()
+        
+        # Item background
+        if highlighted:
+            pygame.draw.rect(row, (100, 100, 140), rect)
+            pygame.draw.rect(row, (255, 215, 0), rect, 3)  # gold border for selected
+        else:
+            pygame.draw.rect(row, (50, 50, 70), rect)
+        
+        pygame.draw.rect(row, (255, 255, 255), rect, 1)
+        
         font = self.pixel_font_medium
         small_font = self.pixel_font_small
         
         # Calculate positions with proper spacing
-        name_y = item_rect.y + 8
+        name_y = rect.y + 8
         desc_start_y = name_y + 30  # More space after name
         desc_line_height = 18
         
         # Name
-        name_text = font.render(upgrade.name, True, (255, 255, 255))
-        screen.blit(name_text, (item_rect.x + 10, name_y))
+        name_text = self._render(font, upgrade.name, (255, 255, 255))
+        row.blit(name_text, (rect.x + 10, name_y))
         
         # Description (multi-line wrap)
-        desc_max_width = item_rect.width - 180
+        desc_max_width = rect.width - 180
         desc_lines = self._wrap_text(small_font, upgrade.description, desc_max_width)
         
         # Calculate description height
         desc_height = len(desc_lines) * desc_line_height
         
         for i, line in enumerate(desc_lines):
-            desc_text = small_font.render(line, True, (200, 200, 200))
-            screen.blit(desc_text, (item_rect.x + 10, desc_start_y + i * desc_line_height))
+            desc_text = self._render(small_font, line, (200, 200, 200))
+            row.blit(desc_text, (rect.x + 10, desc_start_y + i * desc_line_height))
         
         # Level/status indicator - position after description with spacing
         level_y = desc_start_y + desc_height + 12  # Extra spacing after description
@@ -688,66 +958,56 @@ class Store:
         else:  # consumable
             level_text = f"Used {upgrade.current_level} times"
         
-        level_surface = self.pixel_font_small.render(level_text, True, (150, 150, 150))
-        screen.blit(level_surface, (item_rect.x + 10, level_y))
+        level_surface = self._render(small_font, level_text, (150, 150, 150))
+        row.blit(level_surface, (rect.x + 10, level_y))
         
         # Price and buy button
         if upgrade.can_purchase():
             cost = upgrade.get_current_cost()
-            buy_button_rect = pygame.Rect(item_rect.right - 100, item_rect.y + 5, 90, 30)
+            buy_button_rect = pygame.Rect(rect.right - 100, rect.y + 5, 90, 30)
             
             # Button color based on affordability
-            can_afford = coin.get_coin_count() >= cost
-            button_color = (50, 150, 50) if can_afford else (150, 50, 50)
+            button_color = _BUY_BUTTON_COLORS[can_afford]
             
-            pygame.draw.rect(screen, button_color, buy_button_rect)
-            pygame.draw.rect(screen, (255, 255, 255), buy_button_rect, 2)
+            pygame.draw.rect(row, button_color, buy_button_rect)
+            pygame.draw.rect(row, (255, 255, 255), buy_button_rect, 2)
             
             # Button text
-            buy_text = self.pixel_font_small.render(f"{cost}", True, (255, 255, 255))
+            buy_text = self._render(small_font, f"{cost}", (255, 255, 255))
             buy_rect = buy_text.get_rect(center=buy_button_rect.center)
-            screen.blit(buy_text, buy_rect)
+            row.blit(buy_text, buy_rect)
         else:
             # Show "MAX" or "OWNED"
             status_text = "MAX" if upgrade.upgrade_type == "tiered" else "OWNED"
-            status_surface = self.pixel_font_small.render(status_text, True, (100, 100, 100))
-            screen.blit(status_surface, (item_rect.right - 100, item_rect.y + 15))
+            status_surface = self._render(small_font, status_text, (100, 100, 100))
+            row.blit(status_surface, (rect.right - 100, rect.y + 15))
 
     def get_upgrade_level(self, upgrade_id: str) -> int:
         """Get the current level/count for an upgrade."""
-        return self.player_upgrades.get(upgrade_id, 0)
+        upgrade = self._upgrades_by_id.get(upgrade_id)
+        return upgrade.current_level if upgrade else 0
 
     def has_upgrade(self, upgrade_id: str) -> bool:
         """Check if player owns a specific upgrade."""
-        return self.player_upgrades.get(upgrade_id, 0) > 0
+        upgrade = self._upgrades_by_id.get(upgrade_id)
+        return upgrade is not None and upgrade.current_level > 0
 
     def _add_feedback(self, text: str, color: Tuple[int,int,int]):
         """Add a temporary on-screen feedback message."""
+        # Rendered once here; draw() only changes the surface alpha as it fades.
+        # Each message owns its surface, so it does not go through the text cache.
+        surf = self.pixel_font_medium.render(text, True, color)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
         self.feedback_msgs.append({
-            'text': text,
-            'color': color,
+            'surf': surf,
             'life': 90,
             'max_life': 90,
         })
 
-    def _wrap_text(self, font, text: str, max_width: int):
-        # Wrap text into a list of lines that fit within max_width
-        words = text.split()
-        lines = []
-        current = ''
-        for word in words:
-            test = current + (' ' if current else '') + word
-            if font.size(test)[0] <= max_width:
-                current = test
-            else:
-                if current:
-                    lines.append(current)
-                current = word
-        if current:
-            lines.append(current)
-        return lines
-
-
+    def _wrap_text(self, font, text: str, max_width: int) -> Tuple[str, ...]:
+        """Wrap text into lines that fit within max_width (memoised, see _wrap_text_cached)."""
+        return _wrap_text_cached(text, font, max_width)
 
     def set_game_state(self, paddles, player_wall, castle):
         """Set game state references for applying effects."""
@@ -1,8 +1,57 @@
 import pygame, sys, os, random, math
+from functools import lru_cache
 from config import WIDTH, HEIGHT, WHITE, YELLOW, get_key_name, get_control_key
 from utils import generate_grass
 
 
+@lru_cache(maxsize=64)
+def _render_outline_cached(text: str, font: pygame.font.Font, fg, outline, px: int = 1):
+    """Render text with a (2*px+1)-square pixel outline.
+
+    The outline glyphs are rasterised once and stamped at every offset
+    around the text.  Menu strings are a small fixed set, so results are
+    memoised and the returned surface must be treated as read-only.
+    """
+    base = font.render(text, True, fg)
+    outline_surf = font.render(text, True, outline)
+    w, h = base.get_size()
+    surf = pygame.Surface((w + px * 2, h + px * 2), pygame.SRCALPHA)
+    for dx in range(-px, px + 1):
+        for dy in range(-px, px + 1):
+            if dx == 0 and dy == 0:
+                continue
+            surf.blit(outline_surf, (dx + px, dy + px))
+    surf.blit(base, (px, px))
+    # Match the display's pixel format so the cached surface blits on the fast path
+    return surf.convert_alpha()
+
+
+# Loading spinner: degrees advanced per frame and sprite size (radius 15 + line width)
+_SPINNER_STEP = 8
+_SPINNER_SIZE = 40
+
+
+def _render_spinner_frame(base_angle: float) -> pygame.Surface:
+    """Draw the eight-segment loading spinner rotated to *base_angle* degrees.
+
+    The trailing segments fade out through real per-pixel alpha, so the
+    trail blends with the button underneath.
+    """
+    surf = pygame.Surface((_SPINNER_SIZE, _SPINNER_SIZE), pygame.SRCALPHA)
+    center_x = center_y = _SPINNER_SIZE // 2
+    radius = 15
+    # Draw spinning circle segments, each more transparent than the last
+    for j in range(8):
+        angle = math.radians(base_angle + j * 45)
+        color = (255, 255, 0, 255 - j * 28)  # Yellow fading trail
+        start_x = int(center_x + math.cos(angle) * (radius - 5))
+        start_y = int(center_y + math.sin(angle) * (radius - 5))
+        end_x = int(center_x + math.cos(angle) * radius)
+        end_y = int(center_y + math.sin(angle) * radius)
+        pygame.draw.line(surf, color, (start_x, start_y), (end_x, end_y), 3)
+    return surf.convert_alpha()
+
+
 class TutorialOverlay:
     """Main menu overlay: minimalist pixel-art aesthetic with three buttons.
 
@@ -16,6 +65,8 @@ class TutorialOverlay:
         self.active: bool = True
         self.loading: bool = False  # New loading state
         self.loading_angle: float = 0.0  # For spinning loader
+        # One pre-drawn spinner frame per reachable angle (multiples of _SPINNER_STEP)
+        self._spinner_frames = [_render_spinner_frame(a) for a in range(0, 360, _SPINNER_STEP)]
         self.loading_start_time: int = 0  # When loading started
         self.selected_index: int = 0  # Track which button is selected for keyboard nav
 
@@ -53,6 +104,10 @@ class TutorialOverlay:
         self.title_surf = self._render_outline("Castle Pong", self.title_font,
                                              YELLOW, (0, 0, 0), 2)
         self.title_rect = self.title_surf.get_rect(center=(WIDTH // 2, HEIGHT // 3))
+        # Drop shadow: multiply RGB by 0 while preserving alpha -> transparent
+        # background, black glyphs only.  The title surface is cached, so copy.
+        self._title_shadow = self.title_surf.copy()
+        self._title_shadow.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
 
         # Buttons configuration ------------------------------------------------
         self.buttons = [
@@ -69,11 +124,25 @@ class TutorialOverlay:
         self.board_rows = []  # Fetched leaderboard rows
         self.board_scroll = 0
         self.last_board_fetch = 0
+        self.header_font = self._load_pixel_font(20)
+        self.rank_font   = self._load_pixel_font(28)
+        self.hint_font   = self._load_pixel_font(18)
+        # Pre-rendered leaderboard text as (surface, pos) blits and the
+        # board_rows list they were built from (see _build_board_blits)
+        self._board_blits = []
+        self._board_blits_rows = None
+        # Dim overlay behind the leaderboard
+        self._dim_bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self._dim_bg.fill((0, 0, 0))
+        self._dim_bg.set_alpha(200)
 
         # ------------------------------------------------------------------
         # Scrolling grass background (re-uses game grass tile) -------------
         # ------------------------------------------------------------------
-        self.grass      = generate_grass(WIDTH, HEIGHT)
+        self.grass      = generate_grass(WIDTH, HEIGHT).convert()
+        # Two stacked copies so the wrapping scroll is a single blit
+        self._grass_tall = pygame.Surface((WIDTH, HEIGHT * 2)).convert()
+        self._grass_tall.blits([(self.grass, (0, 0)), (self.grass, (0, HEIGHT))], doreturn=False)
         self.scroll_y   = 0.0   # current vertical offset (px)
         self.scroll_spd = 20.0  # pixels / second
 
@@ -90,6 +159,9 @@ class TutorialOverlay:
         start_y = self.title_rect.bottom + 60
         for i, btn in enumerate(self.buttons):
             txt_surf = self._render_outline(btn["label"], self.btn_font, WHITE, (0, 0, 0), 1)
+            # Warm the cache for the hover and loading variants drawn later
+            self._render_outline(btn["label"], self.btn_font, YELLOW, (0, 0, 0), 1)
+            self._render_outline(btn["label"], self.btn_font, (100, 100, 100), (0, 0, 0), 1)
             txt_rect = txt_surf.get_rect()
             # Padding around text
             width  = txt_rect.width  + 40
@@ -120,29 +192,35 @@ class TutorialOverlay:
         
         # Update loading spinner if in loading state
         if self.loading:
-            self.loading_angle += 8.0  # Degrees per frame for smooth rotation
+            self.loading_angle += _SPINNER_STEP  # Degrees per frame for smooth rotation
             if self.loading_angle >= 360:
                 self.loading_angle -= 360
             # Don't process button clicks while loading
-            print(f"[DEBUG] Loading... angle={self.loading_angle:.1f}")
             return
         
-        # Keyboard navigation
+        # Controls can be rebound from the Options button, so resolve the
+        # keys once per update rather than once per event
+        key_up = get_control_key('right_paddle_up')
+        key_down = get_control_key('right_paddle_down')
+        
+        # Single pass: keyboard navigation and left-click detection
         key_nav = False
+        click = False
         for e in events:
             if e.type == pygame.KEYDOWN:
-                if e.key == get_control_key('right_paddle_up'):
+                if e.key == key_up:
                     self.selected_index = (self.selected_index - 1) % len(self.buttons)
                     key_nav = True
-                elif e.key == get_control_key('right_paddle_down'):
+                elif e.key == key_down:
                     self.selected_index = (self.selected_index + 1) % len(self.buttons)
                     key_nav = True
                 elif e.key in (pygame.K_SPACE, pygame.K_RETURN):
                     self.buttons[self.selected_index]["callback"]()
                     key_nav = True
+            elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
+                click = True
         
         mouse = pygame.mouse.get_pos()
-        click = any(e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 for e in events)
         for i, btn in enumerate(self.buttons):
             # If keyboard nav was used, only highlight selected_index
             if key_nav:
@@ -175,8 +253,7 @@ class TutorialOverlay:
         #  Scrolling grass background
         # ----------------------------------------------------------
         y_off = int(self.scroll_y)
-        surface.blit(self.grass, (0, y_off - HEIGHT))
-        surface.blit(self.grass, (0, y_off))
+        surface.blit(self._grass_tall, (0, y_off - HEIGHT))
 
         # Title shadow + text
         self._draw_title(surface)
@@ -225,48 +302,23 @@ class TutorialOverlay:
             
             # Draw loading spinner over Play button
             if self.loading and btn["label"] == "Play":
-                print(f"[DEBUG] Drawing spinner at angle {self.loading_angle:.1f}")
-                center_x, center_y = box.center
-                radius = 15
-                # Draw spinning circle segments with solid colors
-                for j in range(8):
-                    angle = math.radians(self.loading_angle + j * 45)
-                    # Use different shades instead of alpha
-                    brightness = 255 - (j * 25)
-                    if brightness < 100:
-                        brightness = 100
-                    color = (brightness, brightness, 0)  # Yellow gradient
-                    start_x = int(center_x + math.cos(angle) * (radius - 5))
-                    start_y = int(center_y + math.sin(angle) * (radius - 5))
-                    end_x = int(center_x + math.cos(angle) * radius)
-                    end_y = int(center_y + math.sin(angle) * radius)
-                    pygame.draw.line(surface, color, (start_x, start_y), (end_x, end_y), 3)
+                frame = self._spinner_frames[int(self.loading_angle) // _SPINNER_STEP % len(self._spinner_frames)]
+                surface.blit(frame, frame.get_rect(center=box.center))
 
     # ------------------------------------------------------------------
     # Misc helpers
     # ------------------------------------------------------------------
     def _render_outline(self, text: str, font: pygame.font.Font, fg, outline, px: int = 1):
-        base = font.render(text, True, fg)
-        w, h = base.get_size()
-        surf = pygame.Surface((w + px * 2, h + px * 2), pygame.SRCALPHA)
-        for dx in range(-px, px + 1):
-            for dy in range(-px, px + 1):
-                if dx == 0 and dy == 0:
-                    continue
-                surf.blit(font.render(text, True, outline), (dx + px, dy + px))
-        surf.blit(base, (px, px))
-        return surf
+        """Render text with a pixel outline (cached, see _render_outline_cached)."""
+        return _render_outline_cached(text, font, fg, outline, px)
 
     def _draw_title(self, surface):
         # Vertical bobbing offset produces a subtle floating effect
         bob = int(math.sin(self._title_phase) * 4)
         dest_rect = self.title_rect.move(0, bob)
 
-        shadow = self.title_surf.copy()
-        # Multiply RGB by 0 while preserving alpha -> transparent background, black glyphs only
-        shadow.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
-        surface.blit(shadow, dest_rect.move(3, 3))
-        surface.blit(self.title_surf, dest_rect)
+        surface.blits([(self._title_shadow, dest_rect.move(3, 3)),
+                       (self.title_surf, dest_rect)], doreturn=False)
 
     def _load_pixel_font(self, size):
         """Load a bundled TTF pixel font if available, else fallback to monospace."""
@@ -277,7 +329,6 @@ class TutorialOverlay:
     # Button callbacks
     # ------------------------------------------------------------------
     def _on_play(self):
-        print("[DEBUG] Play button clicked - entering loading state")
         # First reset all game state to start fresh
         import sys
         _main = sys.modules['__main__']
@@ -308,7 +359,6 @@ class TutorialOverlay:
 
     def complete_loading(self):
         """Called by main loop when map generation is complete"""
-        print("[DEBUG] Loading complete - starting game")
         pygame.mixer.music.fadeout(400)
         self.active = False
         self.loading = False
@@ -332,14 +382,19 @@ class TutorialOverlay:
 
     def _draw_leaderboard(self, surface: pygame.Surface):
         # Simple centered text list
-        bg = pygame.Surface((WIDTH, HEIGHT))
-        bg.fill((0, 0, 0))
-        bg.set_alpha(200)
-        surface.blit(bg, (0, 0))
+        surface.blit(self._dim_bg, (0, 0))
+
+        # Text only changes when a new board is fetched
+        if self._board_blits_rows is not self.board_rows:
+            self._build_board_blits()
+        surface.blits(self._board_blits, doreturn=False)
 
+    def _build_board_blits(self):
+        """Render the leaderboard title, headers, rows and hint once per fetched board."""
+        blits = []
         title = self._render_outline("Global Leaderboard", self.btn_font, YELLOW, (0, 0, 0), 2)
         rect = title.get_rect(center=(WIDTH // 2, 120))
-        surface.blit(title, rect)
+        blits.append((title, rect))
 
         # Define column widths and spacing for better layout
         column_widths = {
@@ -363,25 +418,15 @@ class TutorialOverlay:
             column_positions[col_name] = current_x
             current_x += width
 
-        # Draw column headers
-        header_font = self._load_pixel_font(20)
+        # Column headers
+        header_font = self.header_font
         header_y = rect.bottom + 15
-        
-        rank_header = header_font.render("RANK", True, (200, 200, 200))
-        name_header = header_font.render("NAME", True, (200, 200, 200))
-        wave_header = header_font.render("WAVE", True, (200, 200, 200))
-        time_header = header_font.render("TIME", True, (200, 200, 200))
-        score_header = header_font.render("SCORE", True, (200, 200, 200))
-        
-        # Position headers using calculated positions
-        surface.blit(rank_header, (column_positions['rank'], header_y))
-        surface.blit(name_header, (column_positions['name'], header_y))
-        surface.blit(wave_header, (column_positions['wave'], header_y))
-        surface.blit(time_header, (column_positions['time'], header_y))
-        surface.blit(score_header, (column_positions['score'], header_y))
+        for col_name in column_widths:
+            header = header_font.render(col_name.upper(), True, (200, 200, 200)).convert_alpha()
+            blits.append((header, (column_positions[col_name], header_y)))
 
         y = header_y + 35
-        rank_font = self._load_pixel_font(28)
+        rank_font = self.rank_font
         for idx, row in enumerate(self.board_rows, 1):
             # Format duration as MM:SS
             duration_sec = row.get('duration', 0)
@@ -389,26 +434,28 @@ class TutorialOverlay:
             seconds = int(duration_sec % 60)
             time_str = f"{minutes}:{seconds:02d}"
             
-            # Render each column
-            rank_txt = rank_font.render(f"{idx}", True, WHITE)
+            # Render each column (converted once, blitted every frame)
+            rank_txt = rank_font.render(f"{idx}", True, WHITE).convert_alpha()
             # Allow longer names to display (up to 20 characters instead of 10)
-            name_txt = rank_font.render(f"{row['name'][:20]}", True, WHITE)
-            wave_txt = rank_font.render(f"{row.get('wave', 1)}", True, WHITE)
-            time_txt = rank_font.render(time_str, True, WHITE)
-            score_txt = rank_font.render(f"{row.get('score', 0)}", True, WHITE)
+            name_txt = rank_font.render(f"{row['name'][:20]}", True, WHITE).convert_alpha()
+            wave_txt = rank_font.render(f"{row.get('wave', 1)}", True, WHITE).convert_alpha()
+            time_txt = rank_font.render(time_str, True, WHITE).convert_alpha()
+            score_txt = rank_font.render(f"{row.get('score', 0)}", True, WHITE).convert_alpha()
             
             # Position each column using calculated positions
-            surface.blit(rank_txt, (column_positions['rank'], y))
-            surface.blit(name_txt, (column_positions['name'], y))
-            surface.blit(wave_txt, (column_positions['wave'], y))
-            surface.blit(time_txt, (column_positions['time'], y))
-            surface.blit(score_txt, (column_positions['score'], y))
+            blits.append((rank_txt, (column_positions['rank'], y)))
+            blits.append((name_txt, (column_positions['name'], y)))
+            blits.append((wave_txt, (column_positions['wave'], y)))
+            blits.append((time_txt, (column_positions['time'], y)))
+            blits.append((score_txt, (column_positions['score'], y)))
             y += 32
 
-        hint_font = self._load_pixel_font(18)
-        hint = hint_font.render("ESC to back", True, WHITE)
+        hint = self.hint_font.render("ESC to back", True, WHITE).convert_alpha()
         hint_rect = hint.get_rect(center=(WIDTH // 2, HEIGHT - 60))
-        surface.blit(hint, hint_rect)
+        blits.append((hint, hint_rect))
+
+        self._board_blits = blits
+        self._board_blits_rows = self.board_rows
 
     # --- Legacy gradient generator retained for reference, unused now ---
     def _create_background(self):